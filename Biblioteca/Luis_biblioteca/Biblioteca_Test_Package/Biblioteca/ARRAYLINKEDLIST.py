@@ -0,0 +1,130 @@
+"""
+BIBLIOTECA
+LINKED LIST RESPALDADA POR ARREGLOS PARALELOS (DATA / NEXT) EN LUGAR DE NODOS.
+LOS ÍNDICES LIBERADOS SE ENCADENAN EN UNA FREE LIST Y SE REUTILIZAN.
+AUTOR: LUIS GIL
+"""
+
+from array import array
+
+from .BASELIST import BASELIST
+
+NIL = -1
+_END = object()
+
+class ARRAYLINKEDLIST(BASELIST):
+    def __init__(self):
+        self.DATA = []
+        self.NEXT = array("q")
+        self.HEAD = NIL
+        self.TAIL = NIL
+        self.FREE = NIL
+        self.SIZE = 0
+
+    def _ALLOCATE(self, DATA):
+        SLOT = self.FREE
+        if SLOT != NIL:
+            self.FREE = self.NEXT[SLOT]
+            self.DATA[SLOT] = DATA
+            self.NEXT[SLOT] = NIL
+            return SLOT
+        self.DATA.append(DATA)
+        self.NEXT.append(NIL)
+        return len(self.DATA) - 1
+
+    def _RELEASE(self, SLOT):
+        self.DATA[SLOT] = None
+        self.NEXT[SLOT] = self.FREE
+        self.FREE = SLOT
+
+    def APPEND(self, DATA):
+        SLOT = self._ALLOCATE(DATA)
+        if self.HEAD == NIL:
+            self.HEAD = SLOT
+        else:
+            self.NEXT[self.TAIL] = SLOT
+        self.TAIL = SLOT
+        self.SIZE += 1
+
+    def PREPEND(self, DATA):
+        SLOT = self._ALLOCATE(DATA)
+        self.NEXT[SLOT] = self.HEAD
+        self.HEAD = SLOT
+        if self.TAIL == NIL:
+            self.TAIL = SLOT
+        self.SIZE += 1
+
+    def EXTEND(self, ITERABLE):
+        """REUTILIZA PRIMERO LOS ÍNDICES LIBRES Y EL RESTO LO AGREGA EN BLOQUE."""
+        ITERATOR = iter(ITERABLE)
+        while self.FREE != NIL:
+            DATA = next(ITERATOR, _END)
+            if DATA is _END:
+                return
+            self.APPEND(DATA)
+        START = len(self.DATA)
+        self.DATA.extend(ITERATOR)
+        END = len(self.DATA)
+        if END == START:
+            return
+        self.NEXT.extend(range(START + 1, END + 1))
+        self.NEXT[END - 1] = NIL
+        if self.HEAD == NIL:
+            self.HEAD = START
+        else:
+            self.NEXT[self.TAIL] = START
+        self.TAIL = END - 1
+        self.SIZE += END - START
+
+    def DELETE(self, DATA):
+        CURRENT = self.HEAD
+        if CURRENT == NIL:
+            return False
+        NEXT = self.NEXT
+        if self.DATA[CURRENT] == DATA:
+            self.HEAD = NEXT[CURRENT]
+            if self.HEAD == NIL:
+                self.TAIL = NIL
+            self._RELEASE(CURRENT)
+            self.SIZE -= 1
+            return True
+        while NEXT[CURRENT] != NIL:
+            FOLLOWING = NEXT[CURRENT]
+            if self.DATA[FOLLOWING] == DATA:
+                if FOLLOWING == self.TAIL:
+                    self.TAIL = CURRENT
+                NEXT[CURRENT] = NEXT[FOLLOWING]
+                self._RELEASE(FOLLOWING)
+                self.SIZE -= 1
+                return True
+            CURRENT = FOLLOWING
+        return False
+
+    def FIND(self, DATA):
+        CURRENT = self.HEAD
+        while CURRENT != NIL:
+            if self.DATA[CURRENT] == DATA:
+                return True
+            CURRENT = self.NEXT[CURRENT]
+        return False
+
+    def TO_LIST(self):
+        RESULT = []
+        DATA = self.DATA
+        NEXT = self.NEXT
+        CURRENT = self.HEAD
+        while CURRENT != NIL:
+            RESULT.append(DATA[CURRENT])
+            CURRENT = NEXT[CURRENT]
+        return RESULT
+
+    def _TAIL_DATA(self):
+        return self.DATA[self.TAIL]
+
+    def __iter__(self):
+        DATA = self.DATA
+        NEXT = self.NEXT
+        CURRENT = self.HEAD
+        while CURRENT != NIL:
+            yield DATA[CURRENT]
+            CURRENT = NEXT[CURRENT]
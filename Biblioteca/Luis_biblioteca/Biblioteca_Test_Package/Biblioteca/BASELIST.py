@@ -0,0 +1,113 @@
+"""
+BIBLIOTECA
+BASE COMÚN DE LAS LISTAS DE LA BIBLIOTECA: PROTOCOLO DE ITERACIÓN, VISTAS,
+IMPRESIÓN Y CONSTRUCTORES MASIVOS. CADA LISTA DEFINE APPEND, PREPEND Y DELETE.
+AUTOR: LUIS GIL
+"""
+
+from itertools import islice
+
+MAX_PRINT = 20
+
+class LISTVIEW:
+    """VISTA PEREZOSA DE UN RANGO DE LA LISTA: NO COPIA NADA, SE RECORRE AL ITERAR."""
+
+    def __init__(self, LIST, START, STOP, STEP):
+        self.LIST = LIST
+        self.RANGE = range(START, STOP, STEP)
+
+    def __iter__(self):
+        if not self.RANGE:
+            return iter(())
+        return islice(self.LIST, self.RANGE.start, self.RANGE.stop, self.RANGE.step)
+
+    def __len__(self):
+        return len(self.RANGE)
+
+    def TO_LIST(self):
+        return list(self)
+
+class BASELIST:
+    def __init__(self):
+        self.HEAD = None
+        self.TAIL = None
+        self.SIZE = 0
+
+    @classmethod
+    def FROM_ITERABLE(cls, ITERABLE):
+        LIST = cls()
+        LIST.EXTEND(ITERABLE)
+        return LIST
+
+    @classmethod
+    def FROM_ARRAY(cls, ARRAY):
+        """ACEPTA ARREGLOS DE NUMPY, array.array O CUALQUIER OBJETO CON BUFFER.
+        EL BUFFER SE CONVIERTE A ESCALARES DE PYTHON EN UNA SOLA LLAMADA EN C."""
+        if hasattr(ARRAY, "tolist"):
+            DATA = ARRAY.tolist()
+        else:
+            DATA = memoryview(ARRAY).tolist()
+        return cls.FROM_ITERABLE(DATA)
+
+    def EXTEND(self, ITERABLE):
+        for DATA in ITERABLE:
+            self.APPEND(DATA)
+
+    def FIND(self, DATA):
+        for X in self:
+            if X == DATA:
+                return True
+        return False
+
+    def LENGTH(self):
+        return self.SIZE
+
+    def IS_EMPTY(self):
+        return self.SIZE == 0
+
+    def TO_LIST(self):
+        return list(self)
+
+    def SLICE(self, START, STOP=None, STEP=None):
+        return self[START:STOP:STEP]
+
+    def _TAIL_DATA(self):
+        return self.TAIL.DATA
+
+    def __iter__(self):
+        CURRENT = self.HEAD
+        while CURRENT:
+            yield CURRENT.DATA
+            CURRENT = CURRENT.NEXT
+
+    def __len__(self):
+        return self.SIZE
+
+    def __contains__(self, DATA):
+        return self.FIND(DATA)
+
+    def __getitem__(self, INDEX):
+        if isinstance(INDEX, slice):
+            START, STOP, STEP = INDEX.indices(self.SIZE)
+            if STEP < 0:
+                raise ValueError("LA LISTA SOLO SE PUEDE RECORRER HACIA ADELANTE")
+            return LISTVIEW(self, START, STOP, STEP)
+        if INDEX < 0:
+            INDEX += self.SIZE
+        if not 0 <= INDEX < self.SIZE:
+            raise IndexError("ÍNDICE FUERA DE RANGO")
+        if INDEX == self.SIZE - 1:
+            return self._TAIL_DATA()
+        return next(islice(self, INDEX, None))
+
+    def __STR__(self, LIMIT=MAX_PRINT):
+        TEXT = " -> ".join(str(X) for X in islice(self, LIMIT))
+        if self.SIZE > LIMIT:
+            TEXT += f" -> ... ({self.SIZE} ELEMENTOS)"
+        return TEXT
+
+    def __str__(self):
+        return self.__STR__()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.__STR__()})"
@@ -0,0 +1,83 @@
+"""
+BIBLIOTECA
+LISTA CIRCULAR DOBLE: TAIL.NEXT ES HEAD Y HEAD.PREV ES TAIL. APPEND Y PREPEND
+REGRESAN EL NODO CREADO PARA QUITARLO DESPUÉS EN O(1) CON REMOVE_NODE.
+AUTOR: LUIS GIL
+"""
+
+from .BASELIST import BASELIST
+from .LINKEDLIST import DNODE
+
+class CIRCULARLIST(BASELIST):
+    def _LINK(self, DATA):
+        # EL NODO NUEVO QUEDA ENTRE TAIL Y HEAD
+        NEW_NODE = DNODE(DATA)
+        if not self.HEAD:
+            NEW_NODE.NEXT = NEW_NODE.PREV = NEW_NODE
+            self.HEAD = self.TAIL = NEW_NODE
+        else:
+            NEW_NODE.PREV = self.TAIL
+            NEW_NODE.NEXT = self.HEAD
+            self.TAIL.NEXT = NEW_NODE
+            self.HEAD.PREV = NEW_NODE
+        self.SIZE += 1
+        return NEW_NODE
+
+    def APPEND(self, DATA):
+        self.TAIL = self._LINK(DATA)
+        return self.TAIL
+
+    def PREPEND(self, DATA):
+        self.HEAD = self._LINK(DATA)
+        return self.HEAD
+
+    def DELETE(self, DATA):
+        CURRENT = self.HEAD
+        for _ in range(self.SIZE):
+            if CURRENT.DATA == DATA:
+                self.REMOVE_NODE(CURRENT)
+                return True
+            CURRENT = CURRENT.NEXT
+        return False
+
+    def REMOVE_NODE(self, NODE):
+        """QUITA UN NODO DE ESTA LISTA SIN RECORRERLA Y REGRESA SU DATO."""
+        # EN LA LISTA CIRCULAR TODO NODO ENLAZADO TIENE PREV; UNO QUITADO NO
+        if NODE.PREV is None:
+            raise ValueError("EL NODO NO ESTÁ EN LA LISTA")
+        if self.SIZE == 1:
+            self.HEAD = self.TAIL = None
+        else:
+            NODE.PREV.NEXT = NODE.NEXT
+            NODE.NEXT.PREV = NODE.PREV
+            if NODE is self.HEAD:
+                self.HEAD = NODE.NEXT
+            if NODE is self.TAIL:
+                self.TAIL = NODE.PREV
+        NODE.PREV = NODE.NEXT = None
+        self.SIZE -= 1
+        return NODE.DATA
+
+    def POP_FRONT(self):
+        if not self.HEAD:
+            raise IndexError("LISTA VACÍA")
+        return self.REMOVE_NODE(self.HEAD)
+
+    def POP_BACK(self):
+        if not self.TAIL:
+            raise IndexError("LISTA VACÍA")
+        return self.REMOVE_NODE(self.TAIL)
+
+    def ROTATE(self, STEPS=1):
+        """AVANZA HEAD STEPS POSICIONES (ROUND ROBIN) SIN MOVER NINGÚN NODO."""
+        if self.SIZE < 2:
+            return
+        for _ in range(STEPS % self.SIZE):
+            self.HEAD = self.HEAD.NEXT
+        self.TAIL = self.HEAD.PREV
+
+    def __iter__(self):
+        CURRENT = self.HEAD
+        for _ in range(self.SIZE):
+            yield CURRENT.DATA
+            CURRENT = CURRENT.NEXT
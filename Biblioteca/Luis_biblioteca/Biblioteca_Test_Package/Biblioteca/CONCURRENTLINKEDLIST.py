@@ -0,0 +1,94 @@
+"""
+BIBLIOTECA
+LINKED LIST PARA PRODUCTORES Y CONSUMIDORES EN VARIOS HILOS (COLA DE DOS
+CANDADOS DE MICHAEL Y SCOTT). HEAD APUNTA A UN NODO CENTINELA:
+  - APPEND / EXTEND SOLO TOMAN TAIL_LOCK.
+  - POP_FRONT SOLO TOMA HEAD_LOCK, ASÍ QUE NO BLOQUEA A LOS PRODUCTORES.
+  - PREPEND Y DELETE TOMAN LOS DOS (SIEMPRE HEAD_LOCK PRIMERO).
+  - ITERAR NO TOMA NINGUNO: UN NODO SE PUBLICA YA COMPLETO AL ENLAZARLO Y UN
+    NODO QUITADO CONSERVA SU NEXT, ASÍ QUE UN LECTOR NUNCA QUEDA COLGADO.
+AUTOR: LUIS GIL
+"""
+
+import threading
+
+from .BASELIST import BASELIST
+from .LINKEDLIST import NODE
+
+class CONCURRENTLINKEDLIST(BASELIST):
+    def __init__(self):
+        self.HEAD = self.TAIL = NODE(None)
+        self.HEAD_LOCK = threading.Lock()
+        self.TAIL_LOCK = threading.Lock()
+        self.APPENDED = 0
+        self.REMOVED = 0
+
+    @property
+    def SIZE(self):
+        return self.APPENDED - self.REMOVED
+
+    def APPEND(self, DATA):
+        NEW_NODE = NODE(DATA)
+        with self.TAIL_LOCK:
+            self.TAIL.NEXT = NEW_NODE
+            self.TAIL = NEW_NODE
+            self.APPENDED += 1
+
+    def EXTEND(self, ITERABLE):
+        """ENLAZA EL LOTE FUERA DEL CANDADO Y LO PUBLICA CON UNA SOLA ASIGNACIÓN."""
+        FIRST = LAST = None
+        COUNT = 0
+        for DATA in ITERABLE:
+            NEW_NODE = NODE(DATA)
+            if LAST:
+                LAST.NEXT = NEW_NODE
+            else:
+                FIRST = NEW_NODE
+            LAST = NEW_NODE
+            COUNT += 1
+        if not FIRST:
+            return
+        with self.TAIL_LOCK:
+            self.TAIL.NEXT = FIRST
+            self.TAIL = LAST
+            self.APPENDED += COUNT
+
+    def PREPEND(self, DATA):
+        NEW_NODE = NODE(DATA)
+        with self.HEAD_LOCK, self.TAIL_LOCK:
+            NEW_NODE.NEXT = self.HEAD.NEXT
+            self.HEAD.NEXT = NEW_NODE
+            if self.TAIL is self.HEAD:
+                self.TAIL = NEW_NODE
+            self.APPENDED += 1
+
+    def POP_FRONT(self):
+        with self.HEAD_LOCK:
+            FIRST = self.HEAD.NEXT
+            if FIRST is None:
+                raise IndexError("LISTA VACÍA")
+            # EL PRIMER NODO SE CONVIERTE EN EL NUEVO CENTINELA
+            self.HEAD = FIRST
+            self.REMOVED += 1
+            return FIRST.DATA
+
+    def DELETE(self, DATA):
+        with self.HEAD_LOCK, self.TAIL_LOCK:
+            PREVIOUS = self.HEAD
+            CURRENT = PREVIOUS.NEXT
+            while CURRENT:
+                if CURRENT.DATA == DATA:
+                    PREVIOUS.NEXT = CURRENT.NEXT
+                    if CURRENT is self.TAIL:
+                        self.TAIL = PREVIOUS
+                    self.REMOVED += 1
+                    return True
+                PREVIOUS = CURRENT
+                CURRENT = CURRENT.NEXT
+            return False
+
+    def __iter__(self):
+        CURRENT = self.HEAD.NEXT
+        while CURRENT:
+            yield CURRENT.DATA
+            CURRENT = CURRENT.NEXT
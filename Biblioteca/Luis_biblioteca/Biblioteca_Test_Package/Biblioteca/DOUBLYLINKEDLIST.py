@@ -0,0 +1,68 @@
+"""
+BIBLIOTECA
+LINKED LIST DOBLE. APPEND Y PREPEND REGRESAN EL NODO CREADO, QUE SIRVE COMO
+HANDLE PARA QUITARLO DESPUÉS EN O(1) CON REMOVE_NODE.
+AUTOR: LUIS GIL
+"""
+
+from .BASELIST import BASELIST
+from .LINKEDLIST import DNODE
+
+class DOUBLYLINKEDLIST(BASELIST):
+    def APPEND(self, DATA):
+        NEW_NODE = DNODE(DATA)
+        if not self.HEAD:
+            self.HEAD = NEW_NODE
+        else:
+            NEW_NODE.PREV = self.TAIL
+            self.TAIL.NEXT = NEW_NODE
+        self.TAIL = NEW_NODE
+        self.SIZE += 1
+        return NEW_NODE
+
+    def PREPEND(self, DATA):
+        NEW_NODE = DNODE(DATA)
+        NEW_NODE.NEXT = self.HEAD
+        if self.HEAD:
+            self.HEAD.PREV = NEW_NODE
+        else:
+            self.TAIL = NEW_NODE
+        self.HEAD = NEW_NODE
+        self.SIZE += 1
+        return NEW_NODE
+
+    def DELETE(self, DATA):
+        CURRENT = self.HEAD
+        while CURRENT:
+            if CURRENT.DATA == DATA:
+                self.REMOVE_NODE(CURRENT)
+                return True
+            CURRENT = CURRENT.NEXT
+        return False
+
+    def REMOVE_NODE(self, NODE):
+        """QUITA UN NODO DE ESTA LISTA SIN RECORRERLA Y REGRESA SU DATO."""
+        # UN NODO YA QUITADO QUEDA SIN PREV NI NEXT; SOLO HEAD PUEDE NO TENER PREV
+        if NODE.PREV is None and NODE is not self.HEAD:
+            raise ValueError("EL NODO NO ESTÁ EN LA LISTA")
+        if NODE.PREV:
+            NODE.PREV.NEXT = NODE.NEXT
+        else:
+            self.HEAD = NODE.NEXT
+        if NODE.NEXT:
+            NODE.NEXT.PREV = NODE.PREV
+        else:
+            self.TAIL = NODE.PREV
+        NODE.PREV = NODE.NEXT = None
+        self.SIZE -= 1
+        return NODE.DATA
+
+    def POP_FRONT(self):
+        if not self.HEAD:
+            raise IndexError("LISTA VACÍA")
+        return self.REMOVE_NODE(self.HEAD)
+
+    def POP_BACK(self):
+        if not self.TAIL:
+            raise IndexError("LISTA VACÍA")
+        return self.REMOVE_NODE(self.TAIL)
@@ -0,0 +1,113 @@
+"""
+BIBLIOTECA
+LINKED LIST CON ÍNDICE HASH VALOR -> NODOS PARA FIND Y DELETE EN O(1).
+UN VALOR ÚNICO GUARDA SU NODO DIRECTAMENTE; CON DUPLICADOS GUARDA UN DEQUE
+CON LOS NODOS EN ORDEN DE LA LISTA, ASÍ DELETE SIGUE QUITANDO LA PRIMERA
+APARICIÓN. LOS VALORES DEBEN SER HASHABLES.
+AUTOR: LUIS GIL
+"""
+
+from collections import deque
+
+from .LINKEDLIST import DNODE, LINKEDLIST
+
+class INDEXEDLINKEDLIST(LINKEDLIST):
+    def __init__(self):
+        LINKEDLIST.__init__(self)
+        self.INDEX = {}
+
+    def APPEND(self, DATA):
+        # LA BÚSQUEDA EN EL ÍNDICE VA PRIMERO: SI DATA NO ES HASHABLE FALLA
+        # ANTES DE ENLAZAR NADA Y LA LISTA QUEDA IGUAL
+        ENTRY = self.INDEX.get(DATA)
+        NEW_NODE = DNODE(DATA)
+        if not self.HEAD:
+            self.HEAD = NEW_NODE
+        else:
+            NEW_NODE.PREV = self.TAIL
+            self.TAIL.NEXT = NEW_NODE
+        self.TAIL = NEW_NODE
+        self.SIZE += 1
+        if ENTRY is None:
+            self.INDEX[DATA] = NEW_NODE
+        elif type(ENTRY) is deque:
+            ENTRY.append(NEW_NODE)
+        else:
+            self.INDEX[DATA] = deque((ENTRY, NEW_NODE))
+
+    def PREPEND(self, DATA):
+        ENTRY = self.INDEX.get(DATA)
+        NEW_NODE = DNODE(DATA)
+        NEW_NODE.NEXT = self.HEAD
+        if self.HEAD:
+            self.HEAD.PREV = NEW_NODE
+        else:
+            self.TAIL = NEW_NODE
+        self.HEAD = NEW_NODE
+        self.SIZE += 1
+        if ENTRY is None:
+            self.INDEX[DATA] = NEW_NODE
+        elif type(ENTRY) is deque:
+            ENTRY.appendleft(NEW_NODE)
+        else:
+            self.INDEX[DATA] = deque((NEW_NODE, ENTRY))
+
+    def EXTEND(self, ITERABLE):
+        INDEX = self.INDEX
+        LAST = self.TAIL
+        COUNT = 0
+        try:
+            for DATA in ITERABLE:
+                ENTRY = INDEX.get(DATA)
+                NEW_NODE = DNODE(DATA)
+                if LAST:
+                    NEW_NODE.PREV = LAST
+                    LAST.NEXT = NEW_NODE
+                else:
+                    self.HEAD = NEW_NODE
+                LAST = NEW_NODE
+                COUNT += 1
+                if ENTRY is None:
+                    INDEX[DATA] = NEW_NODE
+                elif type(ENTRY) is deque:
+                    ENTRY.append(NEW_NODE)
+                else:
+                    INDEX[DATA] = deque((ENTRY, NEW_NODE))
+        finally:
+            # SI UN VALOR FALLA, LOS ANTERIORES QUEDAN ENLAZADOS E INDEXADOS
+            self.TAIL = LAST
+            self.SIZE += COUNT
+
+    def DELETE(self, DATA):
+        ENTRY = self.INDEX.get(DATA)
+        if ENTRY is None:
+            return False
+        if type(ENTRY) is deque:
+            NODE = ENTRY.popleft()
+            if len(ENTRY) == 1:
+                self.INDEX[DATA] = ENTRY[0]
+        else:
+            NODE = ENTRY
+            del self.INDEX[DATA]
+        self._UNLINK(NODE)
+        return True
+
+    def _UNLINK(self, NODE):
+        if NODE.PREV:
+            NODE.PREV.NEXT = NODE.NEXT
+        else:
+            self.HEAD = NODE.NEXT
+        if NODE.NEXT:
+            NODE.NEXT.PREV = NODE.PREV
+        else:
+            self.TAIL = NODE.PREV
+        self.SIZE -= 1
+
+    def FIND(self, DATA):
+        return DATA in self.INDEX
+
+    def COUNT(self, DATA):
+        ENTRY = self.INDEX.get(DATA)
+        if ENTRY is None:
+            return 0
+        return len(ENTRY) if type(ENTRY) is deque else 1
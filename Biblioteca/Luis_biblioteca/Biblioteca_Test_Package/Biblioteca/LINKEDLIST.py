@@ -4,29 +4,60 @@ IMPLEMENTACIÓN DE UNA LINKED LIST SIMPLE EN PYTHON.
 AUTOR: LUIS GIL
 """
 
+from .BASELIST import BASELIST
+
 class NODE:
+    __slots__ = ("DATA", "NEXT")
+
     def __init__(self, DATA):
         self.DATA = DATA
         self.NEXT = None
 
-class LINKEDLIST:
-    def __init__(self):
-        self.HEAD = None
+class DNODE(NODE):
+    __slots__ = ("PREV",)
+
+    def __init__(self, DATA):
+        NODE.__init__(self, DATA)
+        self.PREV = None
 
+class LINKEDLIST(BASELIST):
     def APPEND(self, DATA):
         NEW_NODE = NODE(DATA)
         if not self.HEAD:
             self.HEAD = NEW_NODE
-            return
-        LAST = self.HEAD
-        while LAST.NEXT:
-            LAST = LAST.NEXT
-        LAST.NEXT = NEW_NODE
+        else:
+            self.TAIL.NEXT = NEW_NODE
+        self.TAIL = NEW_NODE
+        self.SIZE += 1
 
     def PREPEND(self, DATA):
         NEW_NODE = NODE(DATA)
         NEW_NODE.NEXT = self.HEAD
         self.HEAD = NEW_NODE
+        if not self.TAIL:
+            self.TAIL = NEW_NODE
+        self.SIZE += 1
+
+    def EXTEND(self, ITERABLE):
+        """ENLAZA TODO EL LOTE EN UNA SOLA PASADA Y LO UNE AL FINAL."""
+        FIRST = LAST = None
+        COUNT = 0
+        for DATA in ITERABLE:
+            NEW_NODE = NODE(DATA)
+            if LAST:
+                LAST.NEXT = NEW_NODE
+            else:
+                FIRST = NEW_NODE
+            LAST = NEW_NODE
+            COUNT += 1
+        if not FIRST:
+            return
+        if self.TAIL:
+            self.TAIL.NEXT = FIRST
+        else:
+            self.HEAD = FIRST
+        self.TAIL = LAST
+        self.SIZE += COUNT
 
     def DELETE(self, DATA):
         CURRENT = self.HEAD
@@ -34,10 +65,16 @@ class LINKEDLIST:
             return False
         if CURRENT.DATA == DATA:
             self.HEAD = CURRENT.NEXT
+            if not self.HEAD:
+                self.TAIL = None
+            self.SIZE -= 1
             return True
         while CURRENT.NEXT:
             if CURRENT.NEXT.DATA == DATA:
+                if CURRENT.NEXT is self.TAIL:
+                    self.TAIL = CURRENT
                 CURRENT.NEXT = CURRENT.NEXT.NEXT
+                self.SIZE -= 1
                 return True
             CURRENT = CURRENT.NEXT
         return False
@@ -57,6 +94,3 @@ class LINKEDLIST:
             RESULT.append(CURRENT.DATA)
             CURRENT = CURRENT.NEXT
         return RESULT
-
-    def __STR__(self):
-        return " -> ".join(str(X) for X in self.TO_LIST())
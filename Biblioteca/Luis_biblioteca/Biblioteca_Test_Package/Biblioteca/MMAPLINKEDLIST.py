@@ -0,0 +1,223 @@
+"""
+BIBLIOTECA
+LINKED LIST PERSISTENTE EN UN ARCHIVO MAPEADO A MEMORIA (mmap).
+CADA NODO ES UN REGISTRO DE TAMAÑO FIJO: NEXT (OFFSET EN EL ARCHIVO) + DATO
+CODIFICADO CON UN FORMATO DE struct ("q", "d", "32s", "qd", ...). AL ABRIR
+SOLO SE LEE LA CABECERA; LOS NODOS SE DECODIFICAN AL RECORRERLOS.
+AUTOR: LUIS GIL
+"""
+
+import mmap
+import os
+import re
+import struct
+
+from .BASELIST import BASELIST
+
+NIL = -1
+MAGIC = b"BLLM"
+VERSION = 1
+# MAGIC, VERSION, FORMATO, TAMAÑO DE REGISTRO, HEAD, TAIL, SIZE, REGISTROS USADOS
+HEADER = struct.Struct("<4sH16sIqqqq")
+HEADER_SIZE = 64
+MIN_CAPACITY = 64
+
+class MMAPLINKEDLIST(BASELIST):
+    def __init__(self, PATH, FORMAT=None):
+        self.PATH = PATH
+        # SOLO SE CREA SI NO EXISTE O ESTÁ VACÍO; UN ARCHIVO AJENO NUNCA SE TRUNCA
+        BYTES_EN_DISCO = os.path.getsize(PATH) if os.path.exists(PATH) else 0
+        if 0 < BYTES_EN_DISCO < HEADER_SIZE:
+            raise ValueError(f"{PATH} NO ES UN ARCHIVO MMAPLINKEDLIST")
+        EXISTS = BYTES_EN_DISCO > 0
+        self.FILE = open(PATH, "r+b" if EXISTS else "w+b")
+        if EXISTS:
+            self.MM = mmap.mmap(self.FILE.fileno(), 0)
+            (MAGIC_READ, VERSION_READ, FORMAT_READ, _, self.HEAD, self.TAIL,
+             self.SIZE, self.COUNT) = HEADER.unpack_from(self.MM, 0)
+            if MAGIC_READ != MAGIC or VERSION_READ != VERSION:
+                self.CLOSE()
+                raise ValueError(f"{PATH} NO ES UN ARCHIVO MMAPLINKEDLIST")
+            FORMAT_READ = FORMAT_READ.rstrip(b"\0").decode("ascii")
+            if FORMAT is not None and FORMAT != FORMAT_READ:
+                self.CLOSE()
+                raise ValueError(f"EL ARCHIVO USA EL FORMATO {FORMAT_READ!r}, NO {FORMAT!r}")
+            self._SET_FORMAT(FORMAT_READ)
+        else:
+            self._SET_FORMAT(FORMAT or "q")
+            self.HEAD = self.TAIL = NIL
+            self.SIZE = self.COUNT = 0
+            self.FILE.truncate(HEADER_SIZE + MIN_CAPACITY * self.RECORD.size)
+            self.MM = mmap.mmap(self.FILE.fileno(), 0)
+            self._SYNC_HEADER()
+
+    def _SET_FORMAT(self, FORMAT):
+        if len(FORMAT) > 16 or FORMAT[:1] in "@=<>!":
+            raise ValueError("FORMATO DE struct INVÁLIDO (SIN ORDEN DE BYTES, MÁX. 16 CARACTERES)")
+        self.FORMAT = FORMAT
+        self.RECORD = struct.Struct("<q" + FORMAT)
+        self.FIELDS = len(struct.Struct("<" + FORMAT).unpack(bytes(self.RECORD.size - 8)))
+        # BYTES MÁXIMOS DE CADA CAMPO "Ns"/"Np" (None PARA LOS NUMÉRICOS)
+        self.LIMITS = []
+        for COUNT, CODE in re.findall(r"(\d*)([a-zA-Z?])", FORMAT):
+            if CODE in "sp":
+                self.LIMITS.append(int(COUNT or 1) - (CODE == "p"))
+            elif CODE != "x":
+                self.LIMITS.extend([None] * int(COUNT or 1))
+
+    def _SYNC_HEADER(self):
+        HEADER.pack_into(self.MM, 0, MAGIC, VERSION, self.FORMAT.encode("ascii"),
+                         self.RECORD.size, self.HEAD, self.TAIL, self.SIZE, self.COUNT)
+
+    def _CAPACITY(self):
+        return (len(self.MM) - HEADER_SIZE) // self.RECORD.size
+
+    def _RESERVE(self, EXTRA):
+        NEEDED = self.COUNT + EXTRA
+        CAPACITY = self._CAPACITY()
+        if NEEDED <= CAPACITY:
+            return
+        while CAPACITY < NEEDED:
+            CAPACITY = max(MIN_CAPACITY, CAPACITY * 2)
+        self.MM.close()
+        self.FILE.truncate(HEADER_SIZE + CAPACITY * self.RECORD.size)
+        self.MM = mmap.mmap(self.FILE.fileno(), 0)
+
+    def _ENCODE(self, DATA):
+        # struct CORTARÍA EN SILENCIO LAS CADENAS LARGAS (INCLUSO A MEDIA LETRA
+        # UTF-8) Y EL REGISTRO YA NO SE PODRÍA LEER: SE RECHAZAN ANTES DE ESCRIBIR
+        VALUES = (DATA,) if self.FIELDS == 1 else tuple(DATA)
+        VALUES = tuple(V.encode("utf-8") if isinstance(V, str) else V for V in VALUES)
+        for V, LIMIT in zip(VALUES, self.LIMITS):
+            if LIMIT is not None and isinstance(V, bytes) and len(V) > LIMIT:
+                raise ValueError(f"{V!r} OCUPA {len(V)} BYTES; EL CAMPO ADMITE {LIMIT}")
+        return VALUES
+
+    def _DECODE(self, VALUES):
+        VALUES = tuple(V.rstrip(b"\0").decode("utf-8") if isinstance(V, bytes) else V
+                       for V in VALUES)
+        return VALUES[0] if self.FIELDS == 1 else VALUES
+
+    def _WRITE(self, DATA, NEXT):
+        OFFSET = HEADER_SIZE + self.COUNT * self.RECORD.size
+        self.RECORD.pack_into(self.MM, OFFSET, NEXT, *self._ENCODE(DATA))
+        self.COUNT += 1
+        return OFFSET
+
+    def _READ(self, OFFSET):
+        VALUES = self.RECORD.unpack_from(self.MM, OFFSET)
+        return VALUES[0], self._DECODE(VALUES[1:])
+
+    def _SET_NEXT(self, OFFSET, NEXT):
+        struct.pack_into("<q", self.MM, OFFSET, NEXT)
+
+    def APPEND(self, DATA):
+        self._RESERVE(1)
+        OFFSET = self._WRITE(DATA, NIL)
+        if self.HEAD == NIL:
+            self.HEAD = OFFSET
+        else:
+            self._SET_NEXT(self.TAIL, OFFSET)
+        self.TAIL = OFFSET
+        self.SIZE += 1
+        self._SYNC_HEADER()
+
+    def PREPEND(self, DATA):
+        self._RESERVE(1)
+        OFFSET = self._WRITE(DATA, self.HEAD)
+        self.HEAD = OFFSET
+        if self.TAIL == NIL:
+            self.TAIL = OFFSET
+        self.SIZE += 1
+        self._SYNC_HEADER()
+
+    @classmethod
+    def FROM_ITERABLE(cls, PATH, ITERABLE, FORMAT=None):
+        LIST = cls(PATH, FORMAT)
+        LIST.EXTEND(ITERABLE)
+        return LIST
+
+    @classmethod
+    def FROM_ARRAY(cls, PATH, ARRAY, FORMAT=None):
+        if hasattr(ARRAY, "tolist"):
+            DATA = ARRAY.tolist()
+        else:
+            DATA = memoryview(ARRAY).tolist()
+        return cls.FROM_ITERABLE(PATH, DATA, FORMAT)
+
+    def EXTEND(self, ITERABLE):
+        if hasattr(ITERABLE, "__len__"):
+            self._RESERVE(len(ITERABLE))
+        try:
+            for DATA in ITERABLE:
+                self._RESERVE(1)
+                OFFSET = self._WRITE(DATA, NIL)
+                if self.HEAD == NIL:
+                    self.HEAD = OFFSET
+                else:
+                    self._SET_NEXT(self.TAIL, OFFSET)
+                self.TAIL = OFFSET
+                self.SIZE += 1
+        finally:
+            # SI UN DATO FALLA, LOS ANTERIORES QUEDAN ENLAZADOS Y REGISTRADOS
+            self._SYNC_HEADER()
+
+    def DELETE(self, DATA):
+        """DESENLAZA LA PRIMERA APARICIÓN; EL REGISTRO SE RECUPERA CON COMPACT."""
+        PREVIOUS = NIL
+        CURRENT = self.HEAD
+        while CURRENT != NIL:
+            NEXT, VALUE = self._READ(CURRENT)
+            if VALUE == DATA:
+                if PREVIOUS == NIL:
+                    self.HEAD = NEXT
+                else:
+                    self._SET_NEXT(PREVIOUS, NEXT)
+                if CURRENT == self.TAIL:
+                    self.TAIL = PREVIOUS
+                self.SIZE -= 1
+                self._SYNC_HEADER()
+                return True
+            PREVIOUS = CURRENT
+            CURRENT = NEXT
+        return False
+
+    def COMPACT(self):
+        """REESCRIBE LOS NODOS EN ORDEN DE LA LISTA, SIN HUECOS, RECORRIÉNDOLA UNA
+        SOLA VEZ HACIA UN ARCHIVO TEMPORAL (NO CARGA LA LISTA EN MEMORIA)."""
+        TEMP_PATH = self.PATH + ".compact"
+        if os.path.exists(TEMP_PATH):
+            os.remove(TEMP_PATH)
+        NEW = MMAPLINKEDLIST(TEMP_PATH, self.FORMAT)
+        NEW._RESERVE(self.SIZE)
+        NEW.EXTEND(self)
+        NEW.MM.close()
+        NEW.FILE.truncate(HEADER_SIZE + max(NEW.COUNT, MIN_CAPACITY) * NEW.RECORD.size)
+        NEW.FILE.close()
+        self.CLOSE()
+        os.replace(TEMP_PATH, self.PATH)
+        self.__init__(self.PATH, self.FORMAT)
+
+    def FLUSH(self):
+        self.MM.flush()
+
+    def CLOSE(self):
+        if getattr(self, "MM", None) is not None and not self.MM.closed:
+            self.MM.flush()
+            self.MM.close()
+        self.FILE.close()
+
+    def _TAIL_DATA(self):
+        return self._READ(self.TAIL)[1]
+
+    def __iter__(self):
+        CURRENT = self.HEAD
+        while CURRENT != NIL:
+            CURRENT, DATA = self._READ(CURRENT)
+            yield DATA
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *EXC):
+        self.CLOSE()
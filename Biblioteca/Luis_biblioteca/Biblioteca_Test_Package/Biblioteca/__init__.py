@@ -1 +1,8 @@
+from .BASELIST import BASELIST
 from .LINKEDLIST import LINKEDLIST
+from .ARRAYLINKEDLIST import ARRAYLINKEDLIST
+from .INDEXEDLINKEDLIST import INDEXEDLINKEDLIST
+from .DOUBLYLINKEDLIST import DOUBLYLINKEDLIST
+from .CIRCULARLIST import CIRCULARLIST
+from .MMAPLINKEDLIST import MMAPLINKEDLIST
+from .CONCURRENTLINKEDLIST import CONCURRENTLINKEDLIST
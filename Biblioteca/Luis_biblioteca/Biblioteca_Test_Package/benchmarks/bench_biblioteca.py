@@ -0,0 +1,209 @@
+"""
+BENCHMARK DE LAS LISTAS DE LA BIBLIOTECA CONTRA list Y collections.deque.
+MIDE APPEND, PREPEND, FIND, DELETE Y TO_LIST Y GUARDA LOS RESULTADOS EN JSON
+PARA PODER COMPARAR VERSIONES.
+
+USO:
+    python benchmarks/bench_biblioteca.py --output actual.json
+    python benchmarks/bench_biblioteca.py --sizes 1000 100000 --structures LINKEDLIST list
+    python benchmarks/bench_biblioteca.py --compare anterior.json --output actual.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Biblioteca
+
+TAMAÑOS = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+OPERACIONES = ["APPEND", "PREPEND", "FIND", "DELETE", "TO_LIST"]
+# LAS BÚSQUEDAS LINEALES SE LIMITAN PARA QUE CADA MEDICIÓN HAGA ~10^7 PASOS
+PASOS_BUSQUEDA = 10 ** 7
+# list.insert(0, X) ES CUADRÁTICO, ARRIBA DE ESTE TAMAÑO NO SE MIDE
+MAX_PREPEND_CUADRATICO = 10 ** 5
+
+
+class ADAPTADOR:
+    """EXPONE list Y deque CON LA MISMA API QUE LAS LISTAS DE LA BIBLIOTECA."""
+
+    def __init__(self, FACTORY, PREPEND):
+        self.FACTORY = FACTORY
+        self._PREPEND = PREPEND
+        self.DATA = FACTORY()
+
+    def __call__(self):
+        return ADAPTADOR(self.FACTORY, self._PREPEND)
+
+    def APPEND(self, DATA):
+        self.DATA.append(DATA)
+
+    def PREPEND(self, DATA):
+        self._PREPEND(self.DATA, DATA)
+
+    def EXTEND(self, ITERABLE):
+        self.DATA.extend(ITERABLE)
+
+    def FIND(self, DATA):
+        return DATA in self.DATA
+
+    def DELETE(self, DATA):
+        try:
+            self.DATA.remove(DATA)
+            return True
+        except ValueError:
+            return False
+
+    def TO_LIST(self):
+        return list(self.DATA)
+
+
+ESTRUCTURAS = {
+    "LINKEDLIST": Biblioteca.LINKEDLIST,
+    "ARRAYLINKEDLIST": Biblioteca.ARRAYLINKEDLIST,
+    "INDEXEDLINKEDLIST": Biblioteca.INDEXEDLINKEDLIST,
+    "DOUBLYLINKEDLIST": Biblioteca.DOUBLYLINKEDLIST,
+    "list": ADAPTADOR(list, lambda L, X: L.insert(0, X)),
+    "deque": ADAPTADOR(deque, deque.appendleft),
+}
+POR_DEFECTO = ["LINKEDLIST", "ARRAYLINKEDLIST", "INDEXEDLINKEDLIST", "list", "deque"]
+
+
+def CRONOMETRAR(FUNCION, REPETICIONES):
+    """REGRESA EL MEJOR TIEMPO EN NANOSEGUNDOS; SETUP CORRE FUERA DEL RELOJ."""
+    MEJOR = None
+    for _ in range(REPETICIONES):
+        CUERPO = FUNCION()
+        INICIO = time.perf_counter_ns()
+        CUERPO()
+        TOTAL = time.perf_counter_ns() - INICIO
+        if MEJOR is None or TOTAL < MEJOR:
+            MEJOR = TOTAL
+    return MEJOR
+
+
+def PREPARAR(NOMBRE, OPERACION, N, ALEATORIO):
+    """REGRESA (CANTIDAD DE OPERACIONES, FÁBRICA DEL CUERPO A CRONOMETRAR)."""
+    CLASE = ESTRUCTURAS[NOMBRE]
+
+    if OPERACION == "APPEND":
+        def FABRICA():
+            LISTA = CLASE()
+            APPEND = LISTA.APPEND
+            return lambda: [APPEND(X) for X in range(N)]
+        return N, FABRICA
+
+    if OPERACION == "PREPEND":
+        if NOMBRE == "list" and N > MAX_PREPEND_CUADRATICO:
+            return 0, None
+        def FABRICA():
+            LISTA = CLASE()
+            PREPEND = LISTA.PREPEND
+            return lambda: [PREPEND(X) for X in range(N)]
+        return N, FABRICA
+
+    if OPERACION == "TO_LIST":
+        def FABRICA():
+            LISTA = CLASE()
+            LISTA.EXTEND(range(N))
+            return LISTA.TO_LIST
+        return 1, FABRICA
+
+    # FIND Y DELETE: VALORES ALEATORIOS QUE SÍ ESTÁN EN LA LISTA
+    K = max(1, min(1000, PASOS_BUSQUEDA // N))
+    OBJETIVOS = [ALEATORIO.randrange(N) for _ in range(K)]
+
+    def FABRICA():
+        LISTA = CLASE()
+        LISTA.EXTEND(range(N))
+        METODO = getattr(LISTA, OPERACION)
+        return lambda: [METODO(X) for X in OBJETIVOS]
+    return K, FABRICA
+
+
+def EJECUTAR(NOMBRES, TAMAÑOS, OPERACIONES, REPETICIONES, SEMILLA):
+    RESULTADOS = []
+    for N in TAMAÑOS:
+        for NOMBRE in NOMBRES:
+            for OPERACION in OPERACIONES:
+                OPS, FABRICA = PREPARAR(NOMBRE, OPERACION, N, random.Random(SEMILLA))
+                if FABRICA is None:
+                    NS = None
+                else:
+                    NS = CRONOMETRAR(FABRICA, REPETICIONES)
+                RESULTADO = {
+                    "estructura": NOMBRE,
+                    "operacion": OPERACION,
+                    "n": N,
+                    "ops": OPS,
+                    "total_ns": NS,
+                    "ns_por_op": None if NS is None else NS / OPS,
+                }
+                RESULTADOS.append(RESULTADO)
+                IMPRIMIR(RESULTADO)
+    return RESULTADOS
+
+
+def IMPRIMIR(RESULTADO, ANTERIOR=None):
+    if RESULTADO["ns_por_op"] is None:
+        TIEMPO = "omitido"
+    else:
+        TIEMPO = f"{RESULTADO['ns_por_op']:,.1f} ns/op"
+    LINEA = (f"{RESULTADO['n']:>10}  {RESULTADO['estructura']:<18}"
+             f"{RESULTADO['operacion']:<9}{TIEMPO:>20}")
+    if ANTERIOR and ANTERIOR["ns_por_op"] and RESULTADO["ns_por_op"]:
+        LINEA += f"  x{RESULTADO['ns_por_op'] / ANTERIOR['ns_por_op']:.2f} vs anterior"
+    print(LINEA)
+
+
+def COMPARAR(ANTERIORES, ACTUALES):
+    """IMPRIME LA RAZÓN ACTUAL / ANTERIOR PARA CADA MEDICIÓN EN COMÚN."""
+    CLAVE = lambda R: (R["estructura"], R["operacion"], R["n"])
+    INDICE = {CLAVE(R): R for R in ANTERIORES}
+    print("\n=== COMPARACIÓN CONTRA LA VERSIÓN ANTERIOR ===")
+    for R in ACTUALES:
+        if CLAVE(R) in INDICE:
+            IMPRIMIR(R, INDICE[CLAVE(R)])
+
+
+def main():
+    PARSER = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    PARSER.add_argument("--sizes", type=int, nargs="+", default=TAMAÑOS)
+    PARSER.add_argument("--structures", nargs="+", default=POR_DEFECTO, choices=sorted(ESTRUCTURAS))
+    PARSER.add_argument("--ops", nargs="+", default=OPERACIONES, choices=OPERACIONES)
+    PARSER.add_argument("--repeat", type=int, default=3)
+    PARSER.add_argument("--seed", type=int, default=2024)
+    PARSER.add_argument("--output", help="ARCHIVO JSON DE SALIDA")
+    PARSER.add_argument("--compare", help="JSON DE UNA CORRIDA ANTERIOR")
+    ARGS = PARSER.parse_args()
+
+    RESULTADOS = EJECUTAR(ARGS.structures, ARGS.sizes, ARGS.ops, ARGS.repeat, ARGS.seed)
+
+    if ARGS.compare:
+        with open(ARGS.compare, encoding="utf-8") as F:
+            COMPARAR(json.load(F)["resultados"], RESULTADOS)
+
+    if ARGS.output:
+        SALIDA = {
+            "meta": {
+                "python": platform.python_version(),
+                "plataforma": platform.platform(),
+                "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "repeticiones": ARGS.repeat,
+                "semilla": ARGS.seed,
+            },
+            "resultados": RESULTADOS,
+        }
+        with open(ARGS.output, "w", encoding="utf-8") as F:
+            json.dump(SALIDA, F, indent=2, ensure_ascii=False)
+        print(f"\nResultados guardados en {ARGS.output}")
+
+
+if __name__ == "__main__":
+    main()
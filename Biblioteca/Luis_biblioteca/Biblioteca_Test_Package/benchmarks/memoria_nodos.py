@@ -0,0 +1,73 @@
+"""
+BENCHMARK DE MEMORIA DE LOS NODOS DE LA BIBLIOTECA.
+COMPARA EL NODE ACTUAL (CON __slots__) CONTRA EL DISEÑO ANTERIOR CON __dict__
+Y CONTRA LA VERSIÓN DE ARREGLOS PARALELOS (ARRAYLINKEDLIST).
+USO: python benchmarks/memoria_nodos.py [N ...]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Biblioteca import ARRAYLINKEDLIST, LINKEDLIST
+from Biblioteca.LINKEDLIST import NODE
+
+
+class DICTNODE:
+    """NODO CON EL DISEÑO ORIGINAL: CADA INSTANCIA LLEVA SU PROPIO __dict__."""
+
+    def __init__(self, DATA):
+        self.DATA = DATA
+        self.NEXT = None
+
+
+def CONSTRUIR(NODE_TYPE, N):
+    HEAD = LAST = NODE_TYPE(0)
+    for I in range(1, N):
+        NEW_NODE = NODE_TYPE(I)
+        LAST.NEXT = NEW_NODE
+        LAST = NEW_NODE
+    return HEAD
+
+
+def CONSTRUIR_LISTA(LIST_TYPE, N):
+    LISTA = LIST_TYPE()
+    LISTA.EXTEND(range(N))
+    return LISTA
+
+
+def MEDIR(CONSTRUCTOR, N):
+    # EL TIEMPO SE TOMA EN UNA PASADA SIN tracemalloc, QUE ENCARECE CADA
+    # ASIGNACIÓN; LA PASADA RASTREADA SOLO CUENTA BYTES.
+    # LOS ENTEROS < 257 ESTÁN CACHEADOS, EL RESTO SE CUENTA IGUAL EN AMBOS DISEÑOS
+    INICIO = time.perf_counter()
+    ESTRUCTURA = CONSTRUCTOR(N)
+    SEGUNDOS = time.perf_counter() - INICIO
+    del ESTRUCTURA
+    tracemalloc.start()
+    ESTRUCTURA = CONSTRUCTOR(N)
+    BYTES, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del ESTRUCTURA
+    return BYTES / N, SEGUNDOS
+
+
+def main():
+    TAMAÑOS = [int(X) for X in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    print(f"{'N':>10}  {'DISEÑO':<22}{'BYTES/ELEM':>12}{'CONSTRUCCIÓN (s)':>18}")
+    for N in TAMAÑOS:
+        for NOMBRE, CONSTRUCTOR in (
+            ("NODE con __dict__", lambda N: CONSTRUIR(DICTNODE, N)),
+            ("NODE con __slots__", lambda N: CONSTRUIR(NODE, N)),
+            ("LINKEDLIST.EXTEND", lambda N: CONSTRUIR_LISTA(LINKEDLIST, N)),
+            ("ARRAYLINKEDLIST", lambda N: CONSTRUIR_LISTA(ARRAYLINKEDLIST, N)),
+        ):
+            BYTES, SEGUNDOS = MEDIR(CONSTRUCTOR, N)
+            print(f"{N:>10}  {NOMBRE:<22}{BYTES:>12.1f}{SEGUNDOS:>18.4f}")
+
+
+if __name__ == "__main__":
+    main()
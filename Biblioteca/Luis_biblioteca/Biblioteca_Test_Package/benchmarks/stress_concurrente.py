@@ -0,0 +1,98 @@
+"""
+PRUEBA DE ESTRÉS MULTIHILO PARA CONCURRENTLINKEDLIST.
+N PRODUCTORES HACEN APPEND, N CONSUMIDORES HACEN POP_FRONT Y UN LECTOR RECORRE
+LA LISTA SIN PARAR. SE COMPARA CONTRA DOUBLYLINKEDLIST PROTEGIDA CON UN SOLO
+CANDADO GLOBAL Y SE REPORTA EL THROUGHPUT (OPS/S) SEGÚN EL NÚMERO DE HILOS.
+USO: python benchmarks/stress_concurrente.py [--threads 1 2 4 8] [--items 100000]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Biblioteca import CONCURRENTLINKEDLIST, DOUBLYLINKEDLIST
+
+
+class CANDADOGLOBAL:
+    """DOUBLYLINKEDLIST CON UN SOLO CANDADO: LA LÍNEA BASE A SUPERAR."""
+
+    def __init__(self):
+        self.LISTA = DOUBLYLINKEDLIST()
+        self.LOCK = threading.Lock()
+
+    def APPEND(self, DATA):
+        with self.LOCK:
+            self.LISTA.APPEND(DATA)
+
+    def POP_FRONT(self):
+        with self.LOCK:
+            return self.LISTA.POP_FRONT()
+
+    def __iter__(self):
+        with self.LOCK:
+            return iter(self.LISTA.TO_LIST())
+
+
+def CORRER(FABRICA, HILOS, ITEMS):
+    LISTA = FABRICA()
+    TOTAL = HILOS * ITEMS
+    CONSUMIDOS = [0] * HILOS
+    TERMINADO = threading.Event()
+    RECORRIDOS = [0]
+
+    def PRODUCTOR(ID):
+        APPEND = LISTA.APPEND
+        for I in range(ITEMS):
+            APPEND((ID, I))
+
+    def CONSUMIDOR(ID):
+        POP = LISTA.POP_FRONT
+        while sum(CONSUMIDOS) < TOTAL:
+            try:
+                POP()
+                CONSUMIDOS[ID] += 1
+            except IndexError:
+                time.sleep(0)
+
+    def LECTOR():
+        while not TERMINADO.is_set():
+            for _ in LISTA:
+                pass
+            RECORRIDOS[0] += 1
+
+    TRABAJADORES = ([threading.Thread(target=PRODUCTOR, args=(I,)) for I in range(HILOS)]
+                    + [threading.Thread(target=CONSUMIDOR, args=(I,)) for I in range(HILOS)])
+    HILO_LECTOR = threading.Thread(target=LECTOR)
+    INICIO = time.perf_counter()
+    HILO_LECTOR.start()
+    for HILO in TRABAJADORES:
+        HILO.start()
+    for HILO in TRABAJADORES:
+        HILO.join()
+    SEGUNDOS = time.perf_counter() - INICIO
+    TERMINADO.set()
+    HILO_LECTOR.join()
+    assert sum(CONSUMIDOS) == TOTAL
+    return 2 * TOTAL / SEGUNDOS, RECORRIDOS[0]
+
+
+def main():
+    PARSER = argparse.ArgumentParser()
+    PARSER.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    PARSER.add_argument("--items", type=int, default=100_000, help="ITEMS POR PRODUCTOR")
+    ARGS = PARSER.parse_args()
+
+    print(f"{'HILOS':>6}  {'LISTA':<22}{'OPS/S':>14}{'RECORRIDOS':>12}")
+    for HILOS in ARGS.threads:
+        for NOMBRE, FABRICA in (("CONCURRENTLINKEDLIST", CONCURRENTLINKEDLIST),
+                                ("CANDADO GLOBAL", CANDADOGLOBAL)):
+            OPS, RECORRIDOS = CORRER(FABRICA, HILOS, ARGS.items)
+            print(f"{HILOS:>6}  {NOMBRE:<22}{OPS:>14,.0f}{RECORRIDOS:>12}")
+
+
+if __name__ == "__main__":
+    main()
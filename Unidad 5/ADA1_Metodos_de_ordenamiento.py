@@ -1,5 +1,7 @@
 import random
 import time
+import operator
+from bisect import bisect_right
 
 # -------------------------------------------
 # MÉTODOS DE ORDENAMIENTO
@@ -46,24 +48,273 @@ def seleccion(arr):
         a[i], a[min_idx] = a[min_idx], a[i]
     return a, pasos
 
+# -------------------------------------------
+# INSERCIÓN BINARIA ADAPTATIVA
+# -------------------------------------------
+def insercion_binaria(arr, en_sitio=False):
+    # La posición de cada elemento se busca con bisect (O(log n) comparaciones)
+    # y el corrimiento se hace con una sola copia de slice. Primero se mide el
+    # tramo inicial que ya viene ordenado: si es toda la lista termina ahí, y
+    # si no, solo se insertan los elementos que siguen. Los que ya llegan en
+    # orden cuestan una comparación. Con en_sitio=True ordena arr sin copiarla.
+    a = arr if en_sitio else arr.copy()
+    n = len(a)
+    pasos = 0
+    corrida = 1
+    while corrida < n:
+        pasos += 1
+        if a[corrida] < a[corrida - 1]:
+            break
+        corrida += 1
+    for i in range(corrida, n):
+        key = a[i]
+        pasos += 1
+        if not key < a[i - 1]:
+            continue
+        pos = bisect_right(a, key, 0, i)
+        pasos += i.bit_length()
+        a[pos + 1:i + 1] = a[pos:i]
+        a[pos] = key
+    return a, pasos
+
+
+# -------------------------------------------
+# INTROSORT: QUICKSORT + HEAPSORT + INSERCIÓN
+# -------------------------------------------
+UMBRAL_INSERCION = 16
+
+
+def introsort(arr):
+    # Quicksort con pivote mediana de tres; si la recursión se pasa de
+    # 2*log2(n) niveles cambia a heapsort, así el peor caso es O(n log n).
+    # Los tramos chicos se terminan con inserción. Pasos = comparaciones.
+    a = arr.copy()
+    if len(a) < 2:
+        return a, 0
+    limite = 2 * len(a).bit_length()
+    pasos = _introsort_rango(a, 0, len(a) - 1, limite)
+    return a, pasos
+
+
+def _introsort_rango(a, ini, fin, limite):
+    pasos = 0
+    while fin - ini + 1 > UMBRAL_INSERCION:
+        if limite == 0:
+            return pasos + _heapsort_rango(a, ini, fin)
+        limite -= 1
+        p, comparaciones = _particion_hoare(a, ini, fin)
+        pasos += comparaciones
+        # Se recursa en la parte más chica y se itera sobre la grande
+        if p - ini < fin - p:
+            pasos += _introsort_rango(a, ini, p, limite)
+            ini = p + 1
+        else:
+            pasos += _introsort_rango(a, p + 1, fin, limite)
+            fin = p
+    return pasos + _insercion_rango(a, ini, fin)
+
+
+def _particion_hoare(a, ini, fin):
+    medio = (ini + fin) // 2
+    if a[medio] < a[ini]:
+        a[ini], a[medio] = a[medio], a[ini]
+    if a[fin] < a[ini]:
+        a[ini], a[fin] = a[fin], a[ini]
+    if a[fin] < a[medio]:
+        a[medio], a[fin] = a[fin], a[medio]
+    # La mediana queda al inicio para que el punto de corte avance siempre
+    a[ini], a[medio] = a[medio], a[ini]
+    pivote = a[ini]
+    pasos = 3
+    i = ini - 1
+    j = fin + 1
+    while True:
+        i += 1
+        pasos += 1
+        while a[i] < pivote:
+            i += 1
+            pasos += 1
+        j -= 1
+        pasos += 1
+        while a[j] > pivote:
+            j -= 1
+            pasos += 1
+        if i >= j:
+            return j, pasos
+        a[i], a[j] = a[j], a[i]
+
+
+def _heapsort_rango(a, ini, fin):
+    pasos = 0
+    n = fin - ini + 1
+
+    def hundir(raiz, tamaño):
+        nonlocal pasos
+        while True:
+            hijo = 2 * raiz + 1
+            if hijo >= tamaño:
+                return
+            if hijo + 1 < tamaño:
+                pasos += 1
+                if a[ini + hijo] < a[ini + hijo + 1]:
+                    hijo += 1
+            pasos += 1
+            if a[ini + raiz] >= a[ini + hijo]:
+                return
+            a[ini + raiz], a[ini + hijo] = a[ini + hijo], a[ini + raiz]
+            raiz = hijo
+
+    for raiz in range(n // 2 - 1, -1, -1):
+        hundir(raiz, n)
+    for ultimo in range(n - 1, 0, -1):
+        a[ini], a[ini + ultimo] = a[ini + ultimo], a[ini]
+        hundir(0, ultimo)
+    return pasos
+
+
+def _insercion_rango(a, ini, fin):
+    pasos = 0
+    for i in range(ini + 1, fin + 1):
+        key = a[i]
+        j = i - 1
+        pasos += 1
+        while j >= ini and a[j] > key:
+            pasos += 1
+            a[j + 1] = a[j]
+            j -= 1
+        a[j + 1] = key
+    return pasos
+
+# -------------------------------------------
+# SELECCIÓN PARCIAL: TOP-K, K-ÉSIMO, MEDIANA
+# Para cuando no hace falta ordenar toda la lista. Todas regresan
+# (resultado, pasos) contando comparaciones, igual que los métodos de arriba.
+# -------------------------------------------
+def nsmallest(arr, k):
+    # Los k menores en orden ascendente con un heap de máximos de tamaño k:
+    # O(n log k) comparaciones en lugar de O(n log n).
+    return _top_k(arr, k, operator.gt)
+
+
+def nlargest(arr, k):
+    # Los k mayores en orden descendente con un heap de mínimos de tamaño k
+    return _top_k(arr, k, operator.lt)
+
+
+def _top_k(arr, k, arriba):
+    # arriba(x, y) es True si x debe quedar más cerca de la raíz que y
+    k = min(k, len(arr))
+    if k <= 0:
+        return [], 0
+    heap = arr[:k]
+    pasos = 0
+
+    def hundir(raiz):
+        nonlocal pasos
+        while True:
+            hijo = 2 * raiz + 1
+            if hijo >= k:
+                return
+            if hijo + 1 < k:
+                pasos += 1
+                if arriba(heap[hijo + 1], heap[hijo]):
+                    hijo += 1
+            pasos += 1
+            if not arriba(heap[hijo], heap[raiz]):
+                return
+            heap[raiz], heap[hijo] = heap[hijo], heap[raiz]
+            raiz = hijo
+
+    for raiz in range(k // 2 - 1, -1, -1):
+        hundir(raiz)
+    for i in range(k, len(arr)):
+        pasos += 1
+        # La raíz es el peor de los k mejores; solo entra quien la supera
+        if arriba(heap[0], arr[i]):
+            heap[0] = arr[i]
+            hundir(0)
+    pasos += _introsort_rango(heap, 0, k - 1, 2 * k.bit_length())
+    if arriba is operator.lt:
+        heap.reverse()
+    return heap, pasos
+
+
+def kth(arr, k):
+    # El valor que quedaría en la posición k (desde 0) si la lista se ordenara.
+    # Introselect: quickselect con la partición de introsort, O(n) en promedio;
+    # si se pasa de 2*log2(n) particiones cambia a heapsort en el tramo.
+    if not 0 <= k < len(arr):
+        raise IndexError("k fuera de rango")
+    a = arr.copy()
+    pasos = _introselect(a, k, 0, len(a) - 1)
+    return a[k], pasos
+
+
+def median(arr):
+    # Con cantidad par regresa el promedio de los dos valores centrales
+    n = len(arr)
+    if n == 0:
+        raise ValueError("la lista está vacía")
+    a = arr.copy()
+    medio = n // 2
+    pasos = _introselect(a, medio, 0, n - 1)
+    if n % 2:
+        return a[medio], pasos
+    # Tras la selección todo a[:medio] es <= a[medio]; el otro central es su máximo
+    pasos += medio - 1
+    return (max(a[:medio]) + a[medio]) / 2, pasos
+
+
+def partial_sort(arr, k):
+    # Deja los k menores ordenados en a[:k]; el resto queda en orden arbitrario.
+    # O(n + k log k) en promedio.
+    a = arr.copy()
+    k = min(k, len(a))
+    if k <= 0:
+        return a, 0
+    pasos = _introselect(a, k - 1, 0, len(a) - 1)
+    pasos += _introsort_rango(a, 0, k - 1, 2 * k.bit_length())
+    return a, pasos
+
+
+def _introselect(a, k, ini, fin):
+    # Deja a[k] en su lugar definitivo, con a[:k] <= a[k] <= a[k+1:]
+    pasos = 0
+    limite = 2 * (fin - ini + 1).bit_length()
+    while fin - ini + 1 > UMBRAL_INSERCION:
+        if limite == 0:
+            return pasos + _heapsort_rango(a, ini, fin)
+        limite -= 1
+        p, comparaciones = _particion_hoare(a, ini, fin)
+        pasos += comparaciones
+        if k <= p:
+            fin = p
+        else:
+            ini = p + 1
+    return pasos + _insercion_rango(a, ini, fin)
+
 # -------------------------------------------
 # SIMULACIÓN DE 1000 PASOS
 # -------------------------------------------
+# Para mediciones serias (varios tamaños, formas de entrada, mediana y
+# percentiles) usar benchmark_ordenamiento.py.
 def simulacion_1000(metodo):
     total_pasos = 0
     total_tiempo = 0
 
+    metodo([random.randint(1, 1000) for _ in range(100)])  # calentamiento
+
     for _ in range(1000):
         datos = [random.randint(1, 1000) for _ in range(100)]  # lista aleatoria
 
-        inicio = time.time()
+        inicio = time.perf_counter_ns()
         _, pasos = metodo(datos)
-        fin = time.time()
+        fin = time.perf_counter_ns()
 
         total_pasos += pasos
         total_tiempo += (fin - inicio)
 
-    return total_pasos, total_tiempo
+    return total_pasos, total_tiempo / 1e9
 
 
 # -------------------------------------------
@@ -75,11 +326,13 @@ def menu():
         print("1. Burbuja")
         print("2. Inserción")
         print("3. Selección")
-        print("4. Simulación de 1000 pasos")
-        print("5. Salir")
+        print("4. Introsort")
+        print("5. Inserción binaria")
+        print("6. Simulación de 1000 pasos")
+        print("7. Salir")
         opcion = input("Elige una opción: ")
 
-        if opcion in ["1","2","3"]:
+        if opcion in ["1","2","3","4","5"]:
             lista = [int(x) for x in input("Ingresa números separados por espacios: ").split()]
 
             if opcion == "1":
@@ -97,7 +350,17 @@ def menu():
                 print("\nResultado:", ordenado)
                 print("Pasos realizados:", pasos)
 
-        elif opcion == "4":
+            elif opcion == "4":
+                ordenado, pasos = introsort(lista)
+                print("\nResultado:", ordenado)
+                print("Pasos realizados:", pasos)
+
+            elif opcion == "5":
+                ordenado, pasos = insercion_binaria(lista)
+                print("\nResultado:", ordenado)
+                print("Pasos realizados:", pasos)
+
+        elif opcion == "6":
             print("\n--- Simulación Burbuja ---")
             pasos, tiempo = simulacion_1000(burbuja)
             print(f"Pasos totales: {pasos}")
@@ -113,7 +376,17 @@ def menu():
             print(f"Pasos totales: {pasos}")
             print(f"Tiempo total: {tiempo:.4f} s")
 
-        elif opcion == "5":
+            print("\n--- Simulación Introsort ---")
+            pasos, tiempo = simulacion_1000(introsort)
+            print(f"Pasos totales: {pasos}")
+            print(f"Tiempo total: {tiempo:.4f} s")
+
+            print("\n--- Simulación Inserción binaria ---")
+            pasos, tiempo = simulacion_1000(insercion_binaria)
+            print(f"Pasos totales: {pasos}")
+            print(f"Tiempo total: {tiempo:.4f} s")
+
+        elif opcion == "7":
             print("Hasta luego 👋")
             break
 
@@ -122,4 +395,5 @@ def menu():
 
 
 # Ejecutar el menú
-menu()
+if __name__ == "__main__":
+    menu()
@@ -0,0 +1,222 @@
+import argparse
+import csv
+import json
+import platform
+import random
+import statistics
+import time
+
+from ADA1_Metodos_de_ordenamiento import (burbuja, insercion, insercion_binaria, introsort,
+                                          seleccion)
+from comparacion import quick_demo, quick_sort, radix_demo, radix_sort
+from ordenamiento_paralelo import merge_sort_paralelo
+
+try:
+    import numpy as np
+    from ordenamiento_numpy import introsort_np, quick_np, radix_np
+except ImportError:
+    np = None
+
+# -------------------------------------------
+# BENCHMARK DE TODOS LOS ORDENAMIENTOS DE LA UNIDAD 5
+# Reemplaza a simulacion_1000: usa perf_counter_ns, corre el calentamiento
+# fuera de la medición, repite cada caso y reporta mediana y percentiles
+# por tamaño y por forma de la entrada. Exporta a CSV y/o JSON.
+#
+# USO:
+#   python benchmark_ordenamiento.py
+#   python benchmark_ordenamiento.py --tamaños 100 10000 --formas aleatorio ordenado
+#   python benchmark_ordenamiento.py --csv resultados.csv --json resultados.json
+# -------------------------------------------
+
+TAMAÑOS = [10**2, 10**3, 10**4, 10**5, 10**6]
+VALOR_MAXIMO = 10**9
+
+
+def _sin_pasos(metodo):
+    return lambda datos: metodo(datos)[0]
+
+
+# nombre: (función que regresa la lista ordenada, preparación fuera del reloj)
+ALGORITMOS = {
+    "burbuja": (_sin_pasos(burbuja), list),
+    "insercion": (_sin_pasos(insercion), list),
+    "seleccion": (_sin_pasos(seleccion), list),
+    "introsort": (_sin_pasos(introsort), list),
+    "insercion_binaria": (_sin_pasos(insercion_binaria), list),
+    "radix_demo": (radix_demo, list),
+    "quick_demo": (_sin_pasos(quick_demo), list),
+    "radix_sort": (radix_sort, list),
+    "quick_sort": (quick_sort, list),
+    "merge_sort_paralelo": (merge_sort_paralelo, list),
+    "sorted": (sorted, list),
+}
+if np is not None:
+    ALGORITMOS.update({
+        "radix_np": (_sin_pasos(radix_np), np.array),
+        "quick_np": (_sin_pasos(quick_np), np.array),
+        "introsort_np": (_sin_pasos(introsort_np), np.array),
+    })
+CUADRATICOS = {"burbuja", "insercion", "seleccion"}
+
+
+# -------------------------------------------
+# FORMAS DE ENTRADA
+# -------------------------------------------
+def aleatorio(n, rng):
+    return [rng.randint(0, VALOR_MAXIMO) for _ in range(n)]
+
+
+def ordenado(n, rng):
+    return sorted(aleatorio(n, rng))
+
+
+def invertido(n, rng):
+    return sorted(aleatorio(n, rng), reverse=True)
+
+
+def pocos_unicos(n, rng):
+    valores = [rng.randint(0, VALOR_MAXIMO) for _ in range(10)]
+    return [rng.choice(valores) for _ in range(n)]
+
+
+def organo(n, rng):
+    # Sube hasta la mitad y luego baja (organ pipe)
+    mitad = sorted(aleatorio(n // 2, rng))
+    return mitad + sorted(aleatorio(n - n // 2, rng), reverse=True)
+
+
+FORMAS = {
+    "aleatorio": aleatorio,
+    "ordenado": ordenado,
+    "invertido": invertido,
+    "pocos_unicos": pocos_unicos,
+    "organo": organo,
+}
+
+
+# -------------------------------------------
+# MEDICIÓN
+# -------------------------------------------
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    posicion = (len(ordenados) - 1) * p / 100
+    abajo = int(posicion)
+    arriba = min(abajo + 1, len(ordenados) - 1)
+    return ordenados[abajo] + (ordenados[arriba] - ordenados[abajo]) * (posicion - abajo)
+
+
+def medir(nombre, datos, repeticiones, calentamiento):
+    metodo, preparar = ALGORITMOS[nombre]
+    esperado = sorted(datos)
+    for _ in range(calentamiento):
+        salida = metodo(preparar(datos))
+        # Los arreglos de NumPy se pasan a lista solo aquí, fuera del reloj
+        if np is not None and isinstance(salida, np.ndarray):
+            salida = salida.tolist()
+        if salida != esperado:
+            raise AssertionError(f"{nombre} no ordenó correctamente")
+    tiempos = []
+    for _ in range(repeticiones):
+        entrada = preparar(datos)
+        inicio = time.perf_counter_ns()
+        metodo(entrada)
+        tiempos.append(time.perf_counter_ns() - inicio)
+    return tiempos
+
+
+def ejecutar(algoritmos, formas, tamaños, repeticiones, calentamiento, presupuesto,
+             limite_cuadratico, semilla):
+    # Si un caso tarda más que presupuesto segundos (mediana) o falla, ese
+    # algoritmo ya no se prueba con tamaños mayores para esa forma.
+    resultados = []
+    for forma in formas:
+        for nombre in algoritmos:
+            detenido = None
+            for n in tamaños:
+                fila = {"algoritmo": nombre, "forma": forma, "n": n}
+                if nombre in CUADRATICOS and n > limite_cuadratico:
+                    detenido = detenido or f"cuadrático, n > {limite_cuadratico}"
+                if detenido:
+                    fila["omitido"] = detenido
+                    resultados.append(fila)
+                    continue
+                datos = FORMAS[forma](n, random.Random(f"{semilla}-{forma}-{n}"))
+                try:
+                    tiempos = medir(nombre, datos, repeticiones, max(1, calentamiento))
+                except (RecursionError, AssertionError) as error:
+                    detenido = f"{type(error).__name__}: {error}"[:80]
+                    fila["omitido"] = detenido
+                    resultados.append(fila)
+                    continue
+                fila.update({
+                    "repeticiones": repeticiones,
+                    "mediana_ns": statistics.median(tiempos),
+                    "p10_ns": percentil(tiempos, 10),
+                    "p90_ns": percentil(tiempos, 90),
+                    "min_ns": min(tiempos),
+                    "max_ns": max(tiempos),
+                })
+                resultados.append(fila)
+                imprimir(fila)
+                if fila["mediana_ns"] > presupuesto * 1e9:
+                    detenido = f"mediana > {presupuesto} s en n = {n}"
+    return resultados
+
+
+def imprimir(fila):
+    print(f"{fila['forma']:<13}{fila['algoritmo']:<21}{fila['n']:>9}"
+          f"{fila['mediana_ns'] / 1e6:>14.3f} ms"
+          f"  [p10 {fila['p10_ns'] / 1e6:.3f}, p90 {fila['p90_ns'] / 1e6:.3f}]")
+
+
+def guardar_csv(ruta, resultados):
+    columnas = ["algoritmo", "forma", "n", "repeticiones", "mediana_ns", "p10_ns",
+                "p90_ns", "min_ns", "max_ns", "omitido"]
+    with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.DictWriter(archivo, fieldnames=columnas)
+        escritor.writeheader()
+        escritor.writerows(resultados)
+
+
+def guardar_json(ruta, resultados, argumentos):
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump({
+            "meta": {
+                "python": platform.python_version(),
+                "plataforma": platform.platform(),
+                "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "argumentos": argumentos,
+            },
+            "resultados": resultados,
+        }, archivo, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de los ordenamientos de la Unidad 5")
+    parser.add_argument("--algoritmos", nargs="+", default=list(ALGORITMOS), choices=list(ALGORITMOS))
+    parser.add_argument("--formas", nargs="+", default=list(FORMAS), choices=list(FORMAS))
+    parser.add_argument("--tamaños", type=int, nargs="+", default=TAMAÑOS)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--calentamiento", type=int, default=1)
+    parser.add_argument("--presupuesto", type=float, default=2.0,
+                        help="segundos por caso antes de dejar de crecer n")
+    parser.add_argument("--limite-cuadratico", type=int, default=10**4)
+    parser.add_argument("--semilla", type=int, default=2024)
+    parser.add_argument("--csv")
+    parser.add_argument("--json")
+    args = parser.parse_args()
+
+    resultados = ejecutar(args.algoritmos, args.formas, args.tamaños, args.repeticiones,
+                          args.calentamiento, args.presupuesto, args.limite_cuadratico,
+                          args.semilla)
+    if args.csv:
+        guardar_csv(args.csv, resultados)
+        print("CSV guardado en", args.csv)
+    if args.json:
+        guardar_json(args.json, resultados, vars(args))
+        print("JSON guardado en", args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,94 +1,348 @@
-def radix_demo(nums):
-    datos = nums[:]   
-    print("\n=== RADIX SORT — Trazo completo ===")
-    print("Arreglo inicial:", datos)
+from array import array
+from itertools import chain
+
+
+# ---------------------------------------------------------
+# OBSERVADORES DE TRAZA
+# Las funciones de ordenamiento no imprimen nada por defecto. Si reciben un
+# observador, lo llaman como observador(evento, **datos) en cada paso; estos
+# dos imprimen el trazo completo que se usa en clase.
+# ---------------------------------------------------------
+def trazar_radix(evento, **d):
+    if evento == "inicio":
+        print("\n=== RADIX SORT — Trazo completo ===")
+        print("Arreglo inicial:", d["datos"])
+    elif evento == "ciclo":
+        print(f"\n-- Ciclo {d['paso']}: dígito exp={d['exp']} --")
+    elif evento == "conteos":
+        print(f"  Conteos base exp={d['exp']}: {d['cuenta']}")
+    elif evento == "acumulados":
+        print(f"  Acumulados exp={d['exp']}: {d['cuenta']}")
+    elif evento == "colocar":
+        print(f"    Colocando {d['valor']} según el dígito {d['dig']}: {d['salida']}")
+    elif evento == "parcial":
+        print("  Resultado parcial:", d["datos"])
+    elif evento == "final":
+        print("\n→ Resultado final RADIX:", d["datos"])
+
+
+def trazar_quick(evento, **d):
+    if evento == "inicio":
+        print("\n=== QUICK SORT — ejecución rastreada ===")
+        print("Lista inicial:", d["arr"])
+    elif evento == "particion":
+        print(f"\n  Partición en rango [{d['ini']}, {d['fin']}], pivote:", d["pivote"])
+    elif evento == "comparar":
+        print(f"    Comparando {d['valor']} con pivote {d['pivote']}")
+    elif evento == "intercambio":
+        print(f"      ↳ Intercambio => {d['arr']}")
+    elif evento == "sin_movimiento":
+        print("      ↳ Sin movimiento")
+    elif evento == "pivote_colocado":
+        print(f"  Pivote colocado en {d['pos']}: {d['arr']}")
+    elif evento == "rango":
+        print("  " * d["nivel"] + f"• quicksort([{d['ini']}, {d['fin']}])")
+    elif evento == "elemento_solo":
+        print("  " * d["nivel"] + f"• elemento solo en índice {d['ini']}, sin acción")
+    elif evento == "rango_vacio":
+        print("  " * d["nivel"] + f"• rango vacío [{d['ini']}, {d['fin']}], continuar")
+    elif evento == "final":
+        print("\n→ Resultado final QUICK:", d["arr"])
+        print("Pivotes usados en orden:", d["pivotes"])
+
+
+def radix_demo(nums, observador=None):
+    datos = nums[:]
+    if observador:
+        observador("inicio", datos=datos)
+    if not datos:
+        return datos
 
     def ordenar_por_exp(arreglo, exp):
         n = len(arreglo)
         salida = [0] * n
         cuenta = [0] * 10
 
-
         for valor in arreglo:
-            dig = (valor // exp) % 10
-            cuenta[dig] += 1
-        print(f"  Conteos base exp={exp}: {cuenta}")
+            cuenta[(valor // exp) % 10] += 1
+        if observador:
+            observador("conteos", exp=exp, cuenta=cuenta)
 
         for i in range(1, 10):
             cuenta[i] += cuenta[i - 1]
-        print(f"  Acumulados exp={exp}: {cuenta}")
+        if observador:
+            observador("acumulados", exp=exp, cuenta=cuenta)
+
+        if observador is None:
+            for i in range(n - 1, -1, -1):
+                valor = arreglo[i]
+                dig = (valor // exp) % 10
+                cuenta[dig] -= 1
+                salida[cuenta[dig]] = valor
+            return salida
 
         for i in range(n - 1, -1, -1):
             dig = (arreglo[i] // exp) % 10
             pos = cuenta[dig] - 1
             salida[pos] = arreglo[i]
             cuenta[dig] -= 1
-            print(f"    Colocando {arreglo[i]} según el dígito {dig}: {salida}")
-
+            observador("colocar", valor=arreglo[i], dig=dig, salida=salida)
         return salida
 
     maximo = max(datos)
     exp = 1
     paso = 1
     while maximo // exp > 0:
-        print(f"\n-- Ciclo {paso}: dígito exp={exp} --")
+        if observador:
+            observador("ciclo", paso=paso, exp=exp)
         datos = ordenar_por_exp(datos, exp)
-        print("  Resultado parcial:", datos)
+        if observador:
+            observador("parcial", datos=datos)
         exp *= 10
         paso += 1
 
-    print("\n→ Resultado final RADIX:", datos)
+    if observador:
+        observador("final", datos=datos)
     return datos
 
 
-def quick_demo(nums):
-    arr = nums[:]   
+def quick_demo(nums, observador=None):
+    arr = nums[:]
     pivotes_usados = []
 
-    print("\n=== QUICK SORT — ejecución rastreada ===")
-    print("Lista inicial:", arr)
+    if observador:
+        observador("inicio", arr=arr)
 
     # ------------------- partición -------------------------
     def partir(ini, fin):
         piv = arr[fin]
         pivotes_usados.append(piv)
-        print(f"\n  Partición en rango [{ini}, {fin}], pivote:", piv)
 
+        if observador is None:
+            i = ini - 1
+            for j in range(ini, fin):
+                if arr[j] <= piv:
+                    i += 1
+                    arr[i], arr[j] = arr[j], arr[i]
+            arr[i + 1], arr[fin] = arr[fin], arr[i + 1]
+            return i + 1
+
+        observador("particion", ini=ini, fin=fin, pivote=piv)
         i = ini - 1
         for j in range(ini, fin):
-            print(f"    Comparando {arr[j]} con pivote {piv}")
+            observador("comparar", valor=arr[j], pivote=piv)
             if arr[j] <= piv:
                 i += 1
                 arr[i], arr[j] = arr[j], arr[i]
-                print(f"      ↳ Intercambio => {arr}")
+                observador("intercambio", arr=arr)
             else:
-                print("      ↳ Sin movimiento")
+                observador("sin_movimiento")
 
         arr[i + 1], arr[fin] = arr[fin], arr[i + 1]
-        print(f"  Pivote colocado en {i + 1}: {arr}")
+        observador("pivote_colocado", pos=i + 1, arr=arr)
         return i + 1
 
     # ------------------- quicksort -------------------------
     def ordenar(ini, fin, nivel=0):
-        tab = "  " * nivel
         if ini < fin:
-            print(tab + f"• quicksort([{ini}, {fin}])")
+            if observador:
+                observador("rango", ini=ini, fin=fin, nivel=nivel)
             piv = partir(ini, fin)
             ordenar(ini, piv - 1, nivel + 1)
             ordenar(piv + 1, fin, nivel + 1)
-        else:
+        elif observador:
             if ini == fin:
-                print(tab + f"• elemento solo en índice {ini}, sin acción")
+                observador("elemento_solo", ini=ini, nivel=nivel)
             else:
-                print(tab + f"• rango vacío [{ini}, {fin}], continuar")
+                observador("rango_vacio", ini=ini, fin=fin, nivel=nivel)
 
     ordenar(0, len(arr) - 1)
 
-    print("\n→ Resultado final QUICK:", arr)
-    print("Pivotes usados en orden:", pivotes_usados)
+    if observador:
+        observador("final", arr=arr, pivotes=pivotes_usados)
     return arr, pivotes_usados
 
 
+# ---------------------------------------------------------
+# RADIX SORT DE PRODUCCIÓN (LSD, BASE 2^k)
+# ---------------------------------------------------------
+def radix_sort(nums, base=256, key=None):
+    # Radix LSD con cubetas de 8 o 16 bits: un entero de 32 bits se ordena en
+    # 4 pasadas (base 256) o 2 (base 65536) en lugar de 10 con base 10.
+    # Acepta negativos (se recorren al mínimo), flotantes IEEE (se convierten
+    # a enteros sin signo que respetan el orden) y una función key para
+    # ordenar registros. Es estable y no modifica la lista original.
+    # Con enteros y flotantes mezclados la clave es el double: los enteros de
+    # más de 2^53 que colapsan en la misma clave se desempatan con su valor
+    # exacto, y los que no caben en un double lanzan OverflowError.
+    if base < 2 or base & (base - 1):
+        raise ValueError("la base debe ser una potencia de 2, por ejemplo 256 o 65536")
+    bits = base.bit_length() - 1
+    datos = list(nums)
+    if len(datos) < 2:
+        return datos
+    claves = datos if key is None else [key(x) for x in datos]
+
+    if all(isinstance(c, int) for c in claves):
+        minimo = min(claves)
+        if key is None:
+            valores = [v - minimo for v in datos] if minimo else datos
+            ordenados = _radix_valores(valores, bits)
+            return [v + minimo for v in ordenados] if minimo else ordenados
+    elif all(isinstance(c, (int, float)) for c in claves):
+        exactas = claves
+        claves = _claves_ieee(claves)
+        minimo = min(claves)
+        if any(isinstance(c, int) and abs(c) > _ENTERO_EXACTO for c in exactas):
+            claves = [c - minimo for c in claves]
+            orden = _desempatar(_radix_indices(claves, bits), claves, exactas)
+            return [datos[i] for i in orden]
+    else:
+        raise TypeError("radix_sort solo ordena claves enteras o flotantes")
+
+    claves = [c - minimo for c in claves]
+    return [datos[i] for i in _radix_indices(claves, bits)]
+
+
+def _desempatar(orden, claves, exactas):
+    # Reordena (estable) cada tramo de claves IEEE iguales por la clave exacta
+    resultado = []
+    inicio = 0
+    while inicio < len(orden):
+        fin = inicio + 1
+        while fin < len(orden) and claves[orden[fin]] == claves[orden[inicio]]:
+            fin += 1
+        tramo = orden[inicio:fin]
+        if len(tramo) > 1:
+            tramo = sorted(tramo, key=exactas.__getitem__)
+        resultado.extend(tramo)
+        inicio = fin
+    return resultado
+
+
+def _claves_ieee(claves):
+    # Negativos: se invierten todos los bits; positivos: se prende el de signo.
+    # Sumar 0.0 convierte -0.0 en 0.0 para que empaten como en sorted
+    crudos = array("Q")
+    crudos.frombytes(array("d", [c + 0.0 for c in claves]).tobytes())
+    return [c ^ _MASCARA_64 if c >> 63 else c | _BIT_SIGNO for c in crudos]
+
+
+_MASCARA_64 = (1 << 64) - 1
+_ENTERO_EXACTO = 2**53
+_BIT_SIGNO = 1 << 63
+
+
+def _radix_valores(valores, bits):
+    mascara = (1 << bits) - 1
+    maximo = max(valores)
+    desplazamiento = 0
+    while maximo >> desplazamiento:
+        cubetas = [[] for _ in range(mascara + 1)]
+        agregar = [c.append for c in cubetas]
+        for v in valores:
+            agregar[(v >> desplazamiento) & mascara](v)
+        valores = list(chain.from_iterable(cubetas))
+        desplazamiento += bits
+    return valores
+
+
+def _radix_indices(claves, bits):
+    mascara = (1 << bits) - 1
+    maximo = max(claves)
+    orden = range(len(claves))
+    desplazamiento = 0
+    while maximo >> desplazamiento:
+        cubetas = [[] for _ in range(mascara + 1)]
+        agregar = [c.append for c in cubetas]
+        for i in orden:
+            agregar[(claves[i] >> desplazamiento) & mascara](i)
+        orden = list(chain.from_iterable(cubetas))
+        desplazamiento += bits
+    return orden
+
+
+# ---------------------------------------------------------
+# QUICKSORT ITERATIVO DE TRES VÍAS
+# ---------------------------------------------------------
+CORTE_INSERCION = 16
+UMBRAL_NINTHER = 128
+
+
+def quick_sort(nums):
+    # Sin recursión: los rangos pendientes van en una pila. Siempre se guarda
+    # la parte más grande y se sigue con la más chica, así la pila nunca pasa
+    # de log2(n) rangos. El pivote es mediana de tres (o ninther en rangos
+    # grandes), por lo que las entradas ya ordenadas o invertidas se parten
+    # a la mitad, y la partición de tres vías (<, ==, >) deja fuera de una vez
+    # todos los iguales al pivote en columnas con pocos valores distintos.
+    arr = list(nums)
+    pila = [(0, len(arr) - 1)]
+    while pila:
+        ini, fin = pila.pop()
+        while fin - ini > CORTE_INSERCION:
+            lt, gt = _particion_3_vias(arr, ini, fin, _elegir_pivote(arr, ini, fin))
+            if lt - ini < fin - gt:
+                pila.append((gt + 1, fin))
+                fin = lt - 1
+            else:
+                pila.append((ini, lt - 1))
+                ini = gt + 1
+        _insercion_rango(arr, ini, fin)
+    return arr
+
+
+def _mediana_de_3(a, b, c):
+    if a < b:
+        if b < c:
+            return b
+        return c if a < c else a
+    if a < c:
+        return a
+    return c if b < c else b
+
+
+def _elegir_pivote(arr, ini, fin):
+    medio = (ini + fin) // 2
+    if fin - ini < UMBRAL_NINTHER:
+        return _mediana_de_3(arr[ini], arr[medio], arr[fin])
+    # Ninther: mediana de las medianas de tres grupos de tres
+    paso = (fin - ini) // 8
+    return _mediana_de_3(
+        _mediana_de_3(arr[ini], arr[ini + paso], arr[ini + 2 * paso]),
+        _mediana_de_3(arr[medio - paso], arr[medio], arr[medio + paso]),
+        _mediana_de_3(arr[fin - 2 * paso], arr[fin - paso], arr[fin]),
+    )
+
+
+def _particion_3_vias(arr, ini, fin, piv):
+    # Deja [ini, lt) < piv, [lt, gt] == piv y (gt, fin] > piv
+    lt = i = ini
+    gt = fin
+    while i <= gt:
+        valor = arr[i]
+        if valor < piv:
+            arr[lt], arr[i] = valor, arr[lt]
+            lt += 1
+            i += 1
+        elif valor > piv:
+            arr[i], arr[gt] = arr[gt], valor
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def _insercion_rango(arr, ini, fin):
+    for i in range(ini + 1, fin + 1):
+        valor = arr[i]
+        j = i - 1
+        while j >= ini and arr[j] > valor:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = valor
+
+
 # ---------------------------------------------------------
 # MENÚ PRINCIPAL
 # ---------------------------------------------------------
@@ -102,10 +356,10 @@ def main():
     eleccion = input("Opción: ").strip()
 
     if eleccion == "1":
-        resultado = radix_demo(base)
+        resultado = radix_demo(base, trazar_radix)
         print("\nNota: RADIX no utiliza pivotes.")
     elif eleccion == "2":
-        ordenada, pivs = quick_demo(base)
+        ordenada, pivs = quick_demo(base, trazar_quick)
         print("\nResumen QUICK:")
         print("  Lista original:", base)
         print("  Ordenada:", ordenada)
@@ -0,0 +1,183 @@
+import heapq
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from array import array
+
+# -------------------------------------------
+# ORDENAMIENTO EXTERNO (ARCHIVOS MÁS GRANDES QUE LA MEMORIA)
+# 1. Se leen corridas que caben en memoria_max bytes, se ordenan con
+#    sorted (Timsort en C, el motor en memoria más rápido) y se guardan
+#    en archivos temporales.
+# 2. Las corridas se mezclan con un heap (k-way merge) leyendo y
+#    escribiendo en streaming. Si hay más corridas que max_archivos se
+#    mezclan por grupos en varias pasadas.
+# Modos:
+#   "enteros"   texto, un entero por línea
+#   "registros" texto, una línea por registro, ordenado por key(línea)
+#   "int64"     binario, enteros de 8 bytes con signo
+# -------------------------------------------
+
+MODOS = ("enteros", "registros", "int64")
+TAMAÑO_INT64 = 8
+
+
+def _costo(elemento):
+    # Memoria aproximada de un elemento dentro de la lista de la corrida
+    return sys.getsizeof(elemento) + 8
+
+
+def _corridas_texto(ruta, memoria_max, modo, key):
+    corrida = []
+    usado = 0
+    with open(ruta, encoding="utf-8") as archivo:
+        for linea in archivo:
+            if modo == "enteros":
+                if not linea.strip():
+                    continue
+                elemento = int(linea)
+            else:
+                elemento = linea if linea.endswith("\n") else linea + "\n"
+            corrida.append(elemento)
+            usado += _costo(elemento)
+            if usado >= memoria_max:
+                yield sorted(corrida, key=key)
+                corrida = []
+                usado = 0
+    if corrida:
+        yield sorted(corrida, key=key)
+
+
+def _corridas_int64(ruta, memoria_max):
+    # sorted convierte a enteros de Python: ~36 bytes cada uno más el puntero
+    por_corrida = max(1, memoria_max // (_costo(2**62) + TAMAÑO_INT64))
+    with open(ruta, "rb") as archivo:
+        while True:
+            bloque = array("q")
+            bloque.frombytes(archivo.read(por_corrida * TAMAÑO_INT64))
+            if not bloque:
+                return
+            yield array("q", sorted(bloque))
+
+
+def _escribir(ruta, elementos, modo, buffer):
+    if modo == "int64":
+        with open(ruta, "wb", buffering=buffer) as archivo:
+            lote = array("q")
+            for elemento in elementos:
+                lote.append(elemento)
+                if len(lote) * TAMAÑO_INT64 >= buffer:
+                    lote.tofile(archivo)
+                    lote = array("q")
+            lote.tofile(archivo)
+        return
+    with open(ruta, "w", encoding="utf-8", buffering=buffer) as archivo:
+        if modo == "enteros":
+            archivo.writelines(f"{elemento}\n" for elemento in elementos)
+        else:
+            archivo.writelines(elementos)
+
+
+def _leer(ruta, modo, buffer):
+    if modo == "int64":
+        with open(ruta, "rb", buffering=buffer) as archivo:
+            while True:
+                bloque = array("q")
+                bloque.frombytes(archivo.read(max(TAMAÑO_INT64, buffer - buffer % TAMAÑO_INT64)))
+                if not bloque:
+                    return
+                yield from bloque
+    else:
+        with open(ruta, encoding="utf-8", buffering=buffer) as archivo:
+            if modo == "enteros":
+                for linea in archivo:
+                    yield int(linea)
+            else:
+                yield from archivo
+
+
+def ordenar_externo(entrada, salida, memoria_max=64 * 2**20, modo="enteros", key=None,
+                    max_archivos=64, directorio_temporal=None):
+    # Regresa un resumen con las corridas generadas, las pasadas de mezcla,
+    # los elementos ordenados y el tiempo total.
+    if modo not in MODOS:
+        raise ValueError(f"modo debe ser uno de {MODOS}")
+    if key is not None and modo != "registros":
+        raise ValueError("key solo aplica al modo 'registros'")
+    if max_archivos < 2:
+        raise ValueError("max_archivos debe ser al menos 2")
+
+    inicio = time.perf_counter()
+    temporal = tempfile.mkdtemp(prefix="orden_externo_", dir=directorio_temporal)
+    try:
+        # Fase 1: corridas ordenadas
+        if modo == "int64":
+            corridas = _corridas_int64(entrada, memoria_max)
+        else:
+            corridas = _corridas_texto(entrada, memoria_max, modo, key)
+        pendientes = []
+        elementos = 0
+        for numero, corrida in enumerate(corridas):
+            ruta = os.path.join(temporal, f"corrida_{numero}")
+            _escribir(ruta, corrida, modo, 2**20)
+            pendientes.append(ruta)
+            elementos += len(corrida)
+            del corrida
+        total_corridas = len(pendientes)
+
+        # Fase 2: mezcla k-way; el presupuesto se reparte entre los buffers
+        pasadas = 0
+        siguiente = total_corridas
+        if not pendientes:
+            open(salida, "wb").close()
+        while pendientes:
+            pasadas += 1
+            grupos = [pendientes[i:i + max_archivos] for i in range(0, len(pendientes), max_archivos)]
+            final = len(grupos) == 1
+            pendientes = []
+            for grupo in grupos:
+                buffer = max(4096, memoria_max // (len(grupo) + 1))
+                if final:
+                    destino = salida
+                else:
+                    destino = os.path.join(temporal, f"corrida_{siguiente}")
+                    siguiente += 1
+                fuentes = [_leer(ruta, modo, buffer) for ruta in grupo]
+                _escribir(destino, heapq.merge(*fuentes, key=key), modo, buffer)
+                for ruta in grupo:
+                    os.remove(ruta)
+                pendientes.append(destino)
+            if final:
+                break
+    finally:
+        shutil.rmtree(temporal, ignore_errors=True)
+
+    return {
+        "corridas": total_corridas,
+        "pasadas_mezcla": pasadas,
+        "elementos": elementos,
+        "segundos": time.perf_counter() - inicio,
+    }
+
+
+# -------------------------------------------
+# DEMOSTRACIÓN
+# -------------------------------------------
+def main():
+    directorio = tempfile.mkdtemp(prefix="demo_externo_")
+    entrada = os.path.join(directorio, "entrada.txt")
+    salida = os.path.join(directorio, "salida.txt")
+    with open(entrada, "w", encoding="utf-8") as archivo:
+        archivo.writelines(f"{random.randint(-10**9, 10**9)}\n" for _ in range(1_000_000))
+
+    resumen = ordenar_externo(entrada, salida, memoria_max=8 * 2**20)
+    print("Resumen:", resumen)
+    print("Tamaño de entrada:", os.path.getsize(entrada), "bytes")
+    shutil.rmtree(directorio)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+import time
+
+import numpy as np
+
+# -------------------------------------------
+# VERSIONES CON NUMPY DE LOS MÉTODOS DE ORDENAMIENTO
+# Cada función recibe una lista o un arreglo y regresa (arreglo_ordenado, pasos)
+# como las de ADA1_Metodos_de_ordenamiento.py. Los ciclos internos se hacen
+# con operaciones vectorizadas; los pasos siguen contando comparaciones.
+# -------------------------------------------
+
+CORTE_QUICK = 512
+
+
+def burbuja_np(arr):
+    # Burbuja par-impar: cada fase compara TODOS los pares (0,1),(2,3)... o
+    # (1,2),(3,4)... de un jalón. Termina tras dos fases seguidas sin cambios.
+    a = np.array(arr, copy=True)
+    n = a.size
+    pasos = 0
+    sin_cambios = 0
+    for fase in range(n):
+        ini = fase % 2
+        izq = a[ini:n - 1:2]
+        der = a[ini + 1:n:2]
+        pasos += izq.size
+        if (izq > der).any():
+            menores = np.minimum(izq, der)
+            mayores = np.maximum(izq, der)
+            a[ini:n - 1:2] = menores
+            a[ini + 1:n:2] = mayores
+            sin_cambios = 0
+        else:
+            sin_cambios += 1
+            if sin_cambios == 2:
+                break
+    return a, pasos
+
+
+def insercion_np(arr):
+    # Inserción binaria: la posición se busca con searchsorted y el
+    # corrimiento del bloque se hace con una sola copia de slice.
+    a = np.array(arr, copy=True)
+    pasos = 0
+    for i in range(1, a.size):
+        key = a[i]
+        pasos += 1
+        if a[i - 1] <= key:
+            continue
+        pos = int(np.searchsorted(a[:i], key, side="right"))
+        pasos += i.bit_length()
+        a[pos + 1:i + 1] = a[pos:i]
+        a[pos] = key
+    return a, pasos
+
+
+def seleccion_np(arr):
+    a = np.array(arr, copy=True)
+    n = a.size
+    pasos = 0
+    for i in range(n - 1):
+        min_idx = i + int(np.argmin(a[i:]))
+        pasos += n - i
+        a[i], a[min_idx] = a[min_idx], a[i]
+    return a, pasos
+
+
+def introsort_np(arr):
+    # np.sort(kind="quicksort") ya es un introsort en C; no expone pasos.
+    return np.sort(np.asarray(arr), kind="quicksort"), None
+
+
+def _claves_radix(a):
+    # Claves sin signo que respetan el orden: los flotantes se pasan por su
+    # representación IEEE (se invierten los negativos) y todo se recorre a 0.
+    # Como en np.sort, -0.0 empata con 0.0 y todos los NaN van al final.
+    if a.dtype.kind == "f":
+        bits = (a.astype(np.float64) + 0.0).view(np.uint64)
+        negativos = (bits >> np.uint64(63)).astype(bool)
+        claves = np.where(negativos, ~bits, bits | np.uint64(1 << 63))
+        claves[np.isnan(a)] = np.iinfo(np.uint64).max
+    elif a.dtype.kind == "u":
+        claves = a.astype(np.uint64)
+    elif a.dtype.kind in "ib":
+        claves = a.astype(np.int64).view(np.uint64) ^ np.uint64(1 << 63)
+    else:
+        raise TypeError("radix_np solo ordena enteros o flotantes")
+    # Recorrer al mínimo ahorra las pasadas de los bits altos que no cambian
+    return claves - claves.min()
+
+
+def radix_np(arr, base=256):
+    # Radix LSD: cada pasada saca el dígito de todos los elementos a la vez,
+    # usa bincount para saltar pasadas donde todos comparten dígito y
+    # reordena con argsort estable (radix en C para dígitos de 8/16 bits).
+    if base not in (256, 65536):
+        raise ValueError("base debe ser 256 o 65536")
+    a = np.asarray(arr)
+    n = a.size
+    if n < 2:
+        return a.copy(), 0
+    claves = _claves_radix(a)
+    bits_digito = 8 if base == 256 else 16
+    tipo_digito = np.uint8 if base == 256 else np.uint16
+    mascara = np.uint64(base - 1)
+    bits_totales = int(claves.max()).bit_length()
+    pasos = 0
+    for desplazamiento in range(0, bits_totales, bits_digito):
+        digitos = ((claves >> np.uint64(desplazamiento)) & mascara).astype(tipo_digito)
+        if np.bincount(digitos, minlength=base).max() == n:
+            continue
+        orden = np.argsort(digitos, kind="stable")
+        claves = claves[orden]
+        a = a[orden]
+        pasos += n
+    return a.copy() if a is arr else a, pasos
+
+
+def quick_np(arr):
+    # Quicksort de tres vías con máscaras booleanas y pila explícita: cada
+    # tramo se divide en menores / iguales / mayores al pivote. Los tramos de
+    # CORTE_QUICK o menos se terminan con np.sort.
+    a = np.asarray(arr)
+    salida = np.empty_like(a)
+    pasos = 0
+    if a.dtype.kind in "fc":
+        # NaN no es menor ni mayor que el pivote y se perdería entre los
+        # iguales; se apartan al final como hace np.sort
+        nan = np.isnan(a)
+        if nan.any():
+            salida[a.size - int(nan.sum()):] = a[nan]
+            a = a[~nan]
+    pila = [(a, 0)]
+    while pila:
+        tramo, inicio = pila.pop()
+        n = tramo.size
+        if n <= CORTE_QUICK:
+            # El np.sort por defecto (SIMD) puede cambiar -0.0 por 0.0 y al
+            # revés; si el tramo tiene ceros se usa el estable, que no los toca
+            ceros = tramo.dtype.kind == "f" and not tramo.all()
+            salida[inicio:inicio + n] = np.sort(tramo, kind="stable" if ceros else None)
+            continue
+        # Mediana de 9 muestras repartidas en el tramo (ninther), así las
+        # entradas en forma de órgano no dejan particiones desbalanceadas
+        muestra = tramo[np.linspace(0, n - 1, 9).astype(np.intp)]
+        pivote = np.partition(muestra, 4)[4]
+        es_menor = tramo < pivote
+        es_mayor = tramo > pivote
+        menores = tramo[es_menor]
+        mayores = tramo[es_mayor]
+        pasos += 2 * n
+        fin_menores = inicio + menores.size
+        fin_iguales = inicio + n - mayores.size
+        # Se copian los originales: -0.0 y 0.0 son iguales al pivote pero distintos
+        salida[fin_menores:fin_iguales] = tramo[~(es_menor | es_mayor)]
+        pila.append((mayores, fin_iguales))
+        pila.append((menores, inicio))
+    return salida, pasos
+
+
+# -------------------------------------------
+# DEMOSTRACIÓN
+# -------------------------------------------
+def main():
+    rng = np.random.default_rng(0)
+    datos = rng.integers(-10**9, 10**9, size=10**6)
+    referencia = np.sort(datos)
+    for nombre, metodo in (("Radix (base 256)", radix_np),
+                           ("Radix (base 65536)", lambda d: radix_np(d, 65536)),
+                           ("Quick con máscaras", quick_np),
+                           ("Introsort de NumPy", introsort_np)):
+        inicio = time.perf_counter()
+        ordenado, pasos = metodo(datos)
+        fin = time.perf_counter()
+        assert np.array_equal(ordenado, referencia)
+        print(f"{nombre:<20} {fin - inicio:8.4f} s   pasos: {pasos}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import heapq
+import os
+import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from ADA1_Metodos_de_ordenamiento import introsort
+from comparacion import quick_sort
+
+# -------------------------------------------
+# MERGE SORT PARALELO CON MEMORIA COMPARTIDA
+# Los datos se copian una sola vez a un bloque de memoria compartida
+# (array 'q' para enteros o 'd' para flotantes). Cada proceso ordena su
+# trozo EN ese bloque, así que los números nunca se serializan con pickle.
+# Al final las corridas ordenadas se mezclan con un heap (k-way merge).
+# -------------------------------------------
+
+MOTORES = {
+    "sorted": sorted,
+    "quick_sort": quick_sort,
+    "introsort": lambda datos: introsort(datos)[0],
+}
+MINIMO_PARALELO = 10_000
+INT64_MIN = -2**63
+INT64_MAX = 2**63 - 1
+
+
+def _tipo_arreglo(datos):
+    # Solo se empaca si el arreglo regresa exactamente los mismos valores:
+    # puros int de 64 bits o puros float. Mezclas, bool, subclases o enteros
+    # más grandes regresan None y se ordenan en serie.
+    if all(type(x) is int for x in datos):
+        if INT64_MIN <= min(datos) and max(datos) <= INT64_MAX:
+            return "q"
+        return None
+    if all(type(x) is float for x in datos):
+        return "d"
+    return None
+
+
+def _ordenar_trozo(nombre, tipo, total, inicio, fin, motor):
+    # Corre en el proceso hijo: se conecta al bloque por nombre y ordena
+    # su rango en el mismo lugar.
+    bloque = shared_memory.SharedMemory(name=nombre)
+    vista = bloque.buf.cast("B")[:total * array(tipo).itemsize].cast(tipo)
+    try:
+        vista[inicio:fin] = array(tipo, MOTORES[motor](vista[inicio:fin].tolist()))
+    finally:
+        vista.release()
+        bloque.close()
+
+
+def _limites(n, partes):
+    tamaño, sobra = divmod(n, partes)
+    inicio = 0
+    for i in range(partes):
+        fin = inicio + tamaño + (1 if i < sobra else 0)
+        yield inicio, fin
+        inicio = fin
+
+
+def merge_sort_paralelo(nums, procesos=None, motor="sorted"):
+    # Regresa una lista nueva ordenada. motor elige cómo ordena cada proceso
+    # su trozo: "sorted" (Timsort en C), "quick_sort" o "introsort".
+    if motor not in MOTORES:
+        raise ValueError(f"motor desconocido: {motor}")
+    datos = list(nums)
+    n = len(datos)
+    procesos = procesos or os.cpu_count() or 1
+    if n < MINIMO_PARALELO or procesos == 1:
+        return list(MOTORES[motor](datos))
+
+    tipo = _tipo_arreglo(datos)
+    if tipo is None:
+        return list(MOTORES[motor](datos))
+    compacto = array(tipo, datos)
+    bloque = shared_memory.SharedMemory(create=True, size=n * compacto.itemsize)
+    vista = bloque.buf.cast("B")[:n * compacto.itemsize].cast(tipo)
+    corridas = []
+    try:
+        vista[:] = compacto
+        del compacto
+        limites = list(_limites(n, procesos))
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            tareas = [ejecutor.submit(_ordenar_trozo, bloque.name, tipo, n, ini, fin, motor)
+                      for ini, fin in limites]
+            for tarea in tareas:
+                tarea.result()
+        corridas = [vista[ini:fin] for ini, fin in limites]
+        return list(heapq.merge(*corridas))
+    finally:
+        for corrida in corridas:
+            corrida.release()
+        vista.release()
+        bloque.close()
+        bloque.unlink()
+
+
+# -------------------------------------------
+# CURVA DE ACELERACIÓN
+# -------------------------------------------
+def curva_aceleracion(n=2_000_000, lista_procesos=None, motor="sorted"):
+    # Regresa [(procesos, segundos, aceleración)] contra el mismo motor en serie
+    lista_procesos = lista_procesos or sorted({1, 2, 4, 8, 16, 32, os.cpu_count() or 1})
+    datos = [random.randint(-10**9, 10**9) for _ in range(n)]
+
+    inicio = time.perf_counter()
+    referencia = list(MOTORES[motor](datos))
+    serie = time.perf_counter() - inicio
+
+    curva = []
+    for procesos in lista_procesos:
+        inicio = time.perf_counter()
+        resultado = merge_sort_paralelo(datos, procesos, motor)
+        segundos = time.perf_counter() - inicio
+        assert resultado == referencia
+        curva.append((procesos, segundos, serie / segundos))
+    return serie, curva
+
+
+def main():
+    for motor, n in (("sorted", 2_000_000), ("quick_sort", 500_000), ("introsort", 500_000)):
+        serie, curva = curva_aceleracion(n, motor=motor)
+        print(f"\n=== Motor {motor}, n = {n:,} — serie: {serie:.3f} s ===")
+        print(f"{'Procesos':>9} {'Tiempo (s)':>12} {'Aceleración':>12}")
+        for procesos, segundos, aceleracion in curva:
+            print(f"{procesos:>9} {segundos:>12.3f} {aceleracion:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,49 +1,139 @@
+import csv
 import hashlib
 import itertools
+import mmap
+import multiprocessing
+import os
 import string
+import struct
+import sys
+import time
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 
 def hash_sha256(texto):
     return hashlib.sha256(texto.encode()).hexdigest()
 
+# FNV-1a de 64 bits: estable entre ejecuciones (no depende de PYTHONHASHSEED)
+# y reparte bien cadenas parecidas, a diferencia de sumar los códigos ASCII
+FNV_OFFSET = 0xcbf29ce484222325
+FNV_PRIMO = 0x100000001b3
+MASCARA_64 = 0xFFFFFFFFFFFFFFFF
+
+
+def fnv1a_64(cadena):
+    h = FNV_OFFSET
+    for byte in cadena.encode():
+        h = ((h ^ byte) * FNV_PRIMO) & MASCARA_64
+    return h
+
+
 class TablaHash:
-    def __init__(self, tamaño):
+    # Cada bucket guarda pares (FNV-1a del correo, dict del usuario): el hash
+    # se calcula una sola vez y se reusa al redimensionar y al comparar
+    def __init__(self, tamaño=8, factor_carga_max=0.75):
         self.tamaño = tamaño
         self.tabla = [[] for _ in range(tamaño)]
-        self.colisiones = 0
+        self.cantidad = 0
+        self.factor_carga_max = factor_carga_max
 
-    # Función hash basada en ASCII
     def funcion_hash(self, cadena):
-        return sum(ord(c) for c in cadena) % self.tamaño
+        return self._indice(fnv1a_64(cadena))
 
-    def insertar(self, correo, nombre, contraseña):
-        indice = self.funcion_hash(correo)
-        bucket = self.tabla[indice]
+    def _indice(self, h):
+        # Los bits bajos de FNV mezclan poco; se pliega la mitad alta antes
+        # del módulo porque el tamaño crece en potencias de 2
+        return (h ^ (h >> 32)) % self.tamaño
 
-        # Verificar si existe
-        for elemento in bucket:
-            if elemento["correo"] == correo:
-                print("Ya existe un usuario con ese correo.")
-                return
+    def factor_carga(self):
+        return self.cantidad / self.tamaño
 
-        if len(bucket) > 0:
-            self.colisiones += 1
+    def _redimensionar(self, nuevo_tamaño):
+        anterior = self.tabla
+        self.tamaño = nuevo_tamaño
+        self.tabla = [[] for _ in range(nuevo_tamaño)]
+        for bucket in anterior:
+            for par in bucket:
+                self.tabla[self._indice(par[0])].append(par)
+
+    @property
+    def colisiones(self):
+        # Elementos que comparten bucket con alguno anterior
+        return sum(len(bucket) - 1 for bucket in self.tabla if bucket)
+
+    def histograma(self):
+        # {longitud de la cadena: cuántos buckets la tienen}
+        conteo = {}
+        for bucket in self.tabla:
+            conteo[len(bucket)] = conteo.get(len(bucket), 0) + 1
+        return dict(sorted(conteo.items()))
+
+    def _reservar(self, adicionales):
+        # Crece de una vez para que una carga masiva no redimensione a cada rato
+        nuevo_tamaño = self.tamaño
+        while self.cantidad + adicionales > nuevo_tamaño * self.factor_carga_max:
+            nuevo_tamaño *= 2
+        if nuevo_tamaño != self.tamaño:
+            self._redimensionar(nuevo_tamaño)
+
+    def _insertar(self, correo, nombre, digest, h=None):
+        # Inserción sin mensajes; digest es el SHA-256 crudo de la contraseña
+        # y h el FNV-1a del correo si ya se calculó. Regresa False si el
+        # correo ya existía.
+        if h is None:
+            h = fnv1a_64(correo)
+        bucket = self.tabla[self._indice(h)]
+
+        # Verificar si existe
+        for guardado, elemento in bucket:
+            if guardado == h and elemento["correo"] == correo:
+                return False
 
         # Guardar contraseña como SHA-256
         elemento = {
             "correo": correo,
             "nombre": nombre,
-            "hash_contraseña": hash_sha256(contraseña)
+            "hash_contraseña": digest.hex()
         }
 
-        bucket.append(elemento)
-        print("Usuario registrado correctamente.")
+        bucket.append((h, elemento))
+        self.cantidad += 1
+        if self.cantidad > self.tamaño * self.factor_carga_max:
+            self._redimensionar(self.tamaño * 2)
+        return True
+
+    def insertar(self, correo, nombre, contraseña):
+        if self._insertar(correo, nombre, hashlib.sha256(contraseña.encode()).digest()):
+            print("Usuario registrado correctamente.")
+        else:
+            print("Ya existe un usuario con ese correo.")
+
+    def cargar_masivo(self, filas, procesos=None):
+        # filas: iterable de (correo, nombre, contraseña). No imprime por fila
+        return _cargar_masivo(self, filas, procesos)
+
+    def cargar_csv(self, ruta, procesos=None):
+        # CSV con encabezado correo,nombre,contraseña
+        return _cargar_masivo(self, _filas_csv(ruta), procesos)
+
+    @classmethod
+    def cargar(cls, ruta):
+        # Reconstruye la tabla desde un snapshot hecho con guardar
+        with TablaHashMapeada(ruta) as snapshot:
+            return snapshot.a_tabla(cls)
+
+    def guardar(self, ruta):
+        # Snapshot binario que se abre con TablaHashMapeada
+        usuarios = ((e["correo"], e["nombre"], bytes.fromhex(e["hash_contraseña"]), h)
+                    for bucket in self.tabla for h, e in bucket)
+        _guardar_snapshot(ruta, usuarios, self.cantidad)
 
     def buscar(self, correo):
-        indice = self.funcion_hash(correo)
-        bucket = self.tabla[indice]
+        h = fnv1a_64(correo)
+        bucket = self.tabla[self._indice(h)]
 
-        for elemento in bucket:
-            if elemento["correo"] == correo:
+        for guardado, elemento in bucket:
+            if guardado == h and elemento["correo"] == correo:
                 return elemento
         return None
 
@@ -55,9 +145,343 @@ class TablaHash:
         return usuario["hash_contraseña"] == hash_sha256(contraseña)
 
 
+
+# -------------------------------
+#   TABLA HASH CON DIRECCIONAMIENTO ABIERTO
+# -------------------------------
+# Marca de casilla borrada (lápida): el sondeo sigue de largo pero se puede reusar
+BORRADO = object()
+TAMAÑO_SHA256 = 32
+
+
+class TablaHashAbierta:
+    # Misma interfaz que TablaHash, pero sin un dict por usuario: todo vive en
+    # arreglos paralelos con una casilla por posición y sondeo lineal.
+    #   correos, nombres  listas de cadenas (None = vacía, BORRADO = lápida)
+    #   hashes            array('Q') con el FNV-1a del correo, para descartar
+    #                     casillas sin comparar cadenas y para redimensionar
+    #   contraseñas       bytearray con el SHA-256 crudo, 32 bytes por casilla
+    def __init__(self, tamaño=8, factor_carga_max=0.7):
+        self.tamaño = 1 << max(3, (tamaño - 1).bit_length())
+        self.factor_carga_max = factor_carga_max
+        self.cantidad = 0
+        self.borrados = 0
+        self._crear_arreglos()
+
+    def _crear_arreglos(self):
+        self.correos = [None] * self.tamaño
+        self.nombres = [None] * self.tamaño
+        self.hashes = array("Q", bytes(8 * self.tamaño))
+        self.contraseñas = bytearray(TAMAÑO_SHA256 * self.tamaño)
+
+    def factor_carga(self):
+        return self.cantidad / self.tamaño
+
+    def _buscar_casilla(self, correo, h):
+        # Regresa (casilla del correo o None, primera casilla libre del recorrido)
+        mascara = self.tamaño - 1
+        i = (h ^ (h >> 32)) & mascara
+        libre = None
+        while True:
+            actual = self.correos[i]
+            if actual is None:
+                return None, (i if libre is None else libre)
+            if actual is BORRADO:
+                if libre is None:
+                    libre = i
+            elif self.hashes[i] == h and actual == correo:
+                return i, libre
+            i = (i + 1) & mascara
+
+    def _redimensionar(self, nuevo_tamaño):
+        # Reinserta solo las casillas ocupadas, así que también limpia las lápidas
+        correos, nombres = self.correos, self.nombres
+        hashes, contraseñas = self.hashes, self.contraseñas
+        self.tamaño = nuevo_tamaño
+        self.borrados = 0
+        self._crear_arreglos()
+        mascara = nuevo_tamaño - 1
+        for j, correo in enumerate(correos):
+            if correo is None or correo is BORRADO:
+                continue
+            h = hashes[j]
+            i = (h ^ (h >> 32)) & mascara
+            while self.correos[i] is not None:
+                i = (i + 1) & mascara
+            self.correos[i] = correo
+            self.nombres[i] = nombres[j]
+            self.hashes[i] = h
+            inicio = TAMAÑO_SHA256 * j
+            self.contraseñas[TAMAÑO_SHA256 * i:TAMAÑO_SHA256 * (i + 1)] = \
+                contraseñas[inicio:inicio + TAMAÑO_SHA256]
+
+    def _reservar(self, adicionales):
+        nuevo_tamaño = self.tamaño
+        while self.cantidad + adicionales > nuevo_tamaño * self.factor_carga_max:
+            nuevo_tamaño *= 2
+        if nuevo_tamaño != self.tamaño:
+            self._redimensionar(nuevo_tamaño)
+
+    def _insertar(self, correo, nombre, digest, h=None):
+        if h is None:
+            h = fnv1a_64(correo)
+        casilla, libre = self._buscar_casilla(correo, h)
+        if casilla is not None:
+            return False
+
+        if self.correos[libre] is BORRADO:
+            self.borrados -= 1
+        self.correos[libre] = correo
+        self.nombres[libre] = nombre
+        self.hashes[libre] = h
+        self.contraseñas[TAMAÑO_SHA256 * libre:TAMAÑO_SHA256 * (libre + 1)] = digest
+        self.cantidad += 1
+        # Las lápidas también alargan los sondeos, así que cuentan para la carga
+        if self.cantidad + self.borrados > self.tamaño * self.factor_carga_max:
+            self._redimensionar(self.tamaño * 2 if self.cantidad > self.tamaño // 4 else self.tamaño)
+        return True
+
+    def insertar(self, correo, nombre, contraseña):
+        if self._insertar(correo, nombre, hashlib.sha256(contraseña.encode()).digest()):
+            print("Usuario registrado correctamente.")
+        else:
+            print("Ya existe un usuario con ese correo.")
+
+    def cargar_masivo(self, filas, procesos=None):
+        return _cargar_masivo(self, filas, procesos)
+
+    def cargar_csv(self, ruta, procesos=None):
+        return _cargar_masivo(self, _filas_csv(ruta), procesos)
+
+    @classmethod
+    def cargar(cls, ruta):
+        with TablaHashMapeada(ruta) as snapshot:
+            return snapshot.a_tabla(cls)
+
+    def guardar(self, ruta):
+        usuarios = ((correo, self.nombres[i],
+                     bytes(self.contraseñas[TAMAÑO_SHA256 * i:TAMAÑO_SHA256 * (i + 1)]),
+                     self.hashes[i])
+                    for i, correo in enumerate(self.correos)
+                    if correo is not None and correo is not BORRADO)
+        _guardar_snapshot(ruta, usuarios, self.cantidad)
+
+    def buscar(self, correo):
+        casilla, _ = self._buscar_casilla(correo, fnv1a_64(correo))
+        if casilla is None:
+            return None
+        inicio = TAMAÑO_SHA256 * casilla
+        return {
+            "correo": correo,
+            "nombre": self.nombres[casilla],
+            "hash_contraseña": self.contraseñas[inicio:inicio + TAMAÑO_SHA256].hex()
+        }
+
+    def eliminar(self, correo):
+        casilla, _ = self._buscar_casilla(correo, fnv1a_64(correo))
+        if casilla is None:
+            return False
+        self.correos[casilla] = BORRADO
+        self.nombres[casilla] = None
+        self.cantidad -= 1
+        self.borrados += 1
+        return True
+
+    def verificar_contraseña(self, correo, contraseña):
+        casilla, _ = self._buscar_casilla(correo, fnv1a_64(correo))
+        if casilla is None:
+            return False
+
+        inicio = TAMAÑO_SHA256 * casilla
+        return self.contraseñas[inicio:inicio + TAMAÑO_SHA256] == \
+            hashlib.sha256(contraseña.encode()).digest()
+
+
+# -------------------------------
+#   CARGA MASIVA
+# -------------------------------
+# Por debajo de esto el arranque de los procesos cuesta más que los hashes
+MINIMO_PARALELO = 50_000
+LOTE_HASH = 20_000
+
+
+def _hashear_lote(filas):
+    # (FNV-1a del correo, SHA-256 de la contraseña) por fila: son lo caro de
+    # insertar, así que se calculan en los procesos y no en el principal
+    return [(fnv1a_64(correo), hashlib.sha256(contraseña.encode()).digest())
+            for correo, _, contraseña in filas]
+
+
+def _hashear_filas(filas, procesos):
+    if procesos == 1 or len(filas) < MINIMO_PARALELO:
+        return _hashear_lote(filas)
+    lotes = [filas[i:i + LOTE_HASH] for i in range(0, len(filas), LOTE_HASH)]
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        return list(itertools.chain.from_iterable(ejecutor.map(_hashear_lote, lotes)))
+
+
+def _filas_csv(ruta):
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        for fila in csv.DictReader(archivo):
+            yield fila["correo"], fila["nombre"], fila["contraseña"]
+
+
+def _cargar_masivo(tabla, filas, procesos):
+    inicio = time.perf_counter()
+    filas = list(filas)
+    hashes = _hashear_filas(filas, procesos)
+    tabla._reservar(len(filas))
+    insertados = 0
+    for (correo, nombre, _), (h, digest) in zip(filas, hashes):
+        insertados += tabla._insertar(correo, nombre, digest, h)
+    return {
+        "leidos": len(filas),
+        "insertados": insertados,
+        "duplicados": len(filas) - insertados,
+        "segundos": time.perf_counter() - inicio,
+    }
+
+
+# -------------------------------
+#   SNAPSHOT BINARIO MAPEABLE
+# -------------------------------
+# Formato (little-endian):
+#   encabezado  MAGIA, versión, reservado, casillas (potencia de 2), usuarios
+#   casillas    (FNV-1a del correo, posición del registro) de 16 bytes cada
+#               una; posición 0 = vacía. Sondeo lineal, carga <= 0.5
+#   registros   largo del correo, largo del nombre, SHA-256 crudo, y luego
+#               el correo y el nombre en UTF-8
+MAGIA = b"TBLHASH\0"
+VERSION_SNAPSHOT = 1
+ENCABEZADO = struct.Struct("<8sIIQQ")
+CASILLA = struct.Struct("<QQ")
+REGISTRO = struct.Struct(f"<HH{TAMAÑO_SHA256}s")
+LARGO_MAXIMO = 0xFFFF
+
+
+def _guardar_snapshot(ruta, usuarios, cantidad):
+    tamaño = 1 << max(3, (2 * cantidad).bit_length())
+    mascara = tamaño - 1
+    casillas = array("Q", bytes(CASILLA.size * tamaño))
+    posicion = ENCABEZADO.size + CASILLA.size * tamaño
+    # Se escribe a un temporal y se reemplaza al final: quien tenga mapeado
+    # el snapshot anterior nunca ve un archivo a medias
+    temporal = ruta + ".tmp"
+    try:
+        with open(temporal, "wb") as archivo:
+            archivo.seek(posicion)
+            for correo, nombre, digest, h in usuarios:
+                correo_bytes = correo.encode()
+                nombre_bytes = nombre.encode()
+                if max(len(correo_bytes), len(nombre_bytes)) > LARGO_MAXIMO:
+                    raise ValueError(f"el correo y el nombre deben ocupar a lo más "
+                                     f"{LARGO_MAXIMO} bytes: {correo[:40]!r}")
+                registro = REGISTRO.pack(len(correo_bytes), len(nombre_bytes), digest) \
+                    + correo_bytes + nombre_bytes
+                archivo.write(registro)
+                i = (h ^ (h >> 32)) & mascara
+                while casillas[2 * i + 1]:
+                    i = (i + 1) & mascara
+                casillas[2 * i] = h
+                casillas[2 * i + 1] = posicion
+                posicion += len(registro)
+            if sys.byteorder == "big":
+                casillas.byteswap()
+            archivo.seek(0)
+            archivo.write(ENCABEZADO.pack(MAGIA, VERSION_SNAPSHOT, 0, tamaño, cantidad))
+            casillas.tofile(archivo)
+        os.replace(temporal, ruta)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
+
+
+class TablaHashMapeada:
+    # Tabla de solo lectura sobre un snapshot mapeado con mmap: abrirla no
+    # lee los usuarios, cada búsqueda toca solo su casilla y su registro
+    # y el sistema operativo carga esas páginas bajo demanda.
+    def __init__(self, ruta):
+        with open(ruta, "rb") as archivo:
+            self._mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mapa) < ENCABEZADO.size:
+            self._mapa.close()
+            raise ValueError("el archivo no es un snapshot de TablaHash")
+        magia, version, _, self.tamaño, self.cantidad = ENCABEZADO.unpack_from(self._mapa)
+        if magia != MAGIA or version != VERSION_SNAPSHOT:
+            self._mapa.close()
+            raise ValueError("el archivo no es un snapshot de TablaHash")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def cerrar(self):
+        self._mapa.close()
+
+    def factor_carga(self):
+        return self.cantidad / self.tamaño
+
+    def _buscar_registro(self, correo):
+        # Regresa (largo del correo, largo del nombre, digest, inicio del texto)
+        h = fnv1a_64(correo)
+        clave = correo.encode()
+        mascara = self.tamaño - 1
+        i = (h ^ (h >> 32)) & mascara
+        while True:
+            guardado, posicion = CASILLA.unpack_from(self._mapa, ENCABEZADO.size + CASILLA.size * i)
+            if posicion == 0:
+                return None
+            if guardado == h:
+                largo_correo, largo_nombre, digest = REGISTRO.unpack_from(self._mapa, posicion)
+                inicio = posicion + REGISTRO.size
+                if self._mapa[inicio:inicio + largo_correo] == clave:
+                    return largo_correo, largo_nombre, digest, inicio
+            i = (i + 1) & mascara
+
+    def buscar(self, correo):
+        registro = self._buscar_registro(correo)
+        if registro is None:
+            return None
+        largo_correo, largo_nombre, digest, inicio = registro
+        inicio_nombre = inicio + largo_correo
+        return {
+            "correo": correo,
+            "nombre": self._mapa[inicio_nombre:inicio_nombre + largo_nombre].decode(),
+            "hash_contraseña": digest.hex()
+        }
+
+    def verificar_contraseña(self, correo, contraseña):
+        registro = self._buscar_registro(correo)
+        if registro is None:
+            return False
+
+        return registro[2] == hashlib.sha256(contraseña.encode()).digest()
+
+    def a_tabla(self, clase=None):
+        # Copia todo a una tabla modificable (TablaHashAbierta por omisión o
+        # TablaHash) reusando los FNV-1a guardados
+        tabla = (clase or TablaHashAbierta)()
+        tabla._reservar(self.cantidad)
+        for i in range(self.tamaño):
+            h, posicion = CASILLA.unpack_from(self._mapa, ENCABEZADO.size + CASILLA.size * i)
+            if posicion == 0:
+                continue
+            largo_correo, largo_nombre, digest = REGISTRO.unpack_from(self._mapa, posicion)
+            inicio = posicion + REGISTRO.size
+            correo = self._mapa[inicio:inicio + largo_correo].decode()
+            nombre = self._mapa[inicio + largo_correo:inicio + largo_correo + largo_nombre].decode()
+            tabla._insertar(correo, nombre, digest, h)
+        return tabla
+
+
 # -------------------------------
 #   FUERZA BRUTA EDUCATIVA
 # -------------------------------
+# Versión en serie para la clase: se queda a propósito porque se lee de
+# corrido. Para auditar de verdad se usa fuerza_bruta_paralela.
 def fuerza_bruta(hash_objetivo):
     caracteres = string.ascii_lowercase  # Solo letras minúsculas
     print("\nIntentando descubrir una contraseña SIMPLE de 1 a 3 letras...\n")
@@ -70,54 +494,168 @@ def fuerza_bruta(hash_objetivo):
                 return
     print("No se pudo encontrar la contraseña (era muy fuerte).")
 
-tabla = TablaHash(10)
-
-while True:
-    print("\n===== MENÚ =====")
-    print("1. Registrar usuario")
-    print("2. Buscar usuario")
-    print("3. Verificar contraseña")
-    print("4. Fuerza bruta DEMOSTRATIVA (solo hashes simples)")
-    print("5. Mostrar colisiones")
-    print("6. Salir")
-
-    opcion = input("Selecciona una opción: ")
-
-    if opcion == "1":
-        correo = input("Correo: ")
-        nombre = input("Nombre: ")
-        contraseña = input("Contraseña: ")
-        tabla.insertar(correo, nombre, contraseña)
-
-    elif opcion == "2":
-        correo = input("Correo a buscar: ")
-        usuario = tabla.buscar(correo)
-        if usuario:
-            print("Usuario encontrado:")
-            print(usuario)
-        else:
-            print("No existe ese usuario.")
 
-    elif opcion == "3":
-        correo = input("Correo: ")
-        contraseña = input("Contraseña: ")
-        if tabla.verificar_contraseña(correo, contraseña):
-            print("Contraseña correcta.")
-        else:
-            print("Contraseña incorrecta.")
+# -------------------------------
+#   FUERZA BRUTA PARALELA (AUDITORÍA)
+# -------------------------------
+# Para auditar offline los hashes guardados: el espacio de contraseñas se
+# reparte por prefijos entre procesos y todos paran en cuanto uno encuentra.
+REVISAR_CADA = 4096
+_encontrada = None
+
+
+def _iniciar_trabajador(evento):
+    global _encontrada
+    _encontrada = evento
+
+
+def _probar_prefijo(objetivo, simbolos, prefijo, largo_sufijo):
+    # El estado SHA-256 del prefijo se calcula una vez y se copia por candidato
+    base = hashlib.sha256(prefijo)
+    probados = 0
+    for sufijo in itertools.product(simbolos, repeat=largo_sufijo):
+        candidato = b"".join(sufijo)
+        h = base.copy()
+        h.update(candidato)
+        probados += 1
+        if h.digest() == objetivo:
+            _encontrada.set()
+            return (prefijo + candidato).decode(), probados
+        if probados % REVISAR_CADA == 0 and _encontrada.is_set():
+            break
+    return None, probados
+
+
+def _tareas(simbolos, longitud_min, longitud_max, procesos):
+    # Prefijos lo bastante largos para tener varias tareas por proceso
+    for longitud in range(longitud_min, longitud_max + 1):
+        largo_prefijo = 0
+        while largo_prefijo < longitud and len(simbolos) ** largo_prefijo < 4 * procesos:
+            largo_prefijo += 1
+        for prefijo in itertools.product(simbolos, repeat=largo_prefijo):
+            yield b"".join(prefijo), longitud - largo_prefijo
+
 
-    elif opcion == "4":
-        print("\n=== DEMOSTRACIÓN DE FUERZA BRUTA ===")
-        texto = input("Ingresa una contraseña sencilla (solo minúsculas, 1-3 letras): ")
-        h = hash_sha256(texto)
-        print(f"Hash generado: {h}")
-        fuerza_bruta(h)
+def fuerza_bruta_paralela(hash_objetivo, caracteres=string.ascii_lowercase,
+                          longitud_min=1, longitud_max=3, procesos=None):
+    # Regresa {"contraseña" (o None), "probados", "segundos", "por_segundo"}
+    if not caracteres or longitud_min < 1 or longitud_min > longitud_max:
+        raise ValueError("se necesita un alfabeto y 1 <= longitud_min <= longitud_max")
+    procesos = procesos or os.cpu_count() or 1
+    objetivo = bytes.fromhex(hash_objetivo)
+    simbolos = [c.encode() for c in dict.fromkeys(caracteres)]
+    evento = multiprocessing.Event()
+    contraseña = None
+    probados = 0
+    inicio = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_trabajador,
+                             initargs=(evento,)) as ejecutor:
+        pendientes = {ejecutor.submit(_probar_prefijo, objetivo, simbolos, prefijo, largo)
+                      for prefijo, largo in _tareas(simbolos, longitud_min, longitud_max, procesos)}
+        while pendientes and contraseña is None:
+            listas, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+            for tarea in listas:
+                encontrada, n = tarea.result()
+                probados += n
+                contraseña = contraseña or encontrada
+        for tarea in pendientes:
+            tarea.cancel()
+        for tarea in pendientes:
+            if not tarea.cancelled():
+                probados += tarea.result()[1]
+    segundos = time.perf_counter() - inicio
+    return {
+        "contraseña": contraseña,
+        "probados": probados,
+        "segundos": segundos,
+        "por_segundo": probados / segundos if segundos else 0.0,
+    }
 
-    elif opcion == "5":
-        print(f"Colisiones registradas: {tabla.colisiones}")
+def menu():
+    tabla = TablaHash()
+
+    while True:
+        print("\n===== MENÚ =====")
+        print("1. Registrar usuario")
+        print("2. Buscar usuario")
+        print("3. Verificar contraseña")
+        print("4. Fuerza bruta DEMOSTRATIVA (solo hashes simples)")
+        print("5. Mostrar colisiones e histograma")
+        print("6. Importar usuarios desde CSV")
+        print("7. Guardar snapshot")
+        print("8. Cargar snapshot")
+        print("9. Salir")
+
+        opcion = input("Selecciona una opción: ")
+
+        if opcion == "1":
+            correo = input("Correo: ")
+            nombre = input("Nombre: ")
+            contraseña = input("Contraseña: ")
+            tabla.insertar(correo, nombre, contraseña)
+
+        elif opcion == "2":
+            correo = input("Correo a buscar: ")
+            usuario = tabla.buscar(correo)
+            if usuario:
+                print("Usuario encontrado:")
+                print(usuario)
+            else:
+                print("No existe ese usuario.")
+
+        elif opcion == "3":
+            correo = input("Correo: ")
+            contraseña = input("Contraseña: ")
+            if tabla.verificar_contraseña(correo, contraseña):
+                print("Contraseña correcta.")
+            else:
+                print("Contraseña incorrecta.")
+
+        elif opcion == "4":
+            print("\n=== DEMOSTRACIÓN DE FUERZA BRUTA ===")
+            texto = input("Ingresa una contraseña sencilla (solo minúsculas, 1-3 letras): ")
+            h = hash_sha256(texto)
+            print(f"Hash generado: {h}")
+            print("\nIntentando descubrir una contraseña SIMPLE de 1 a 3 letras...\n")
+            resultado = fuerza_bruta_paralela(h)
+            if resultado["contraseña"] is not None:
+                print(f"✔ Contraseña encontrada (solo demostración): {resultado['contraseña']}")
+            else:
+                print("No se pudo encontrar la contraseña (era muy fuerte).")
+            print(f"{resultado['probados']:,} candidatos en {resultado['segundos']:.2f} s "
+                  f"({resultado['por_segundo']:,.0f} por segundo)")
+
+        elif opcion == "5":
+            print(f"Usuarios: {tabla.cantidad}  Buckets: {tabla.tamaño}  "
+                  f"Factor de carga: {tabla.factor_carga():.2f}")
+            print(f"Colisiones registradas: {tabla.colisiones}")
+            print("Longitud de cadena -> buckets:")
+            for longitud, buckets in tabla.histograma().items():
+                print(f"  {longitud}: {buckets}")
+
+        elif opcion == "6":
+            ruta = input("Ruta del CSV (encabezado correo,nombre,contraseña): ")
+            print("Resumen:", tabla.cargar_csv(ruta))
+
+        elif opcion == "7":
+            ruta = input("Ruta del snapshot: ")
+            tabla.guardar(ruta)
+            print(f"{tabla.cantidad} usuarios guardados en {ruta}")
+
+        elif opcion == "8":
+            ruta = input("Ruta del snapshot: ")
+            try:
+                tabla = TablaHash.cargar(ruta)
+                print(f"{tabla.cantidad} usuarios cargados.")
+            except (OSError, ValueError) as error:
+                print(f"No se pudo cargar: {error}")
+
+        elif opcion == "9":
+            break
+
+        else:
+            print("Opción inválida.")
 
-    elif opcion == "6":
-        break
 
-    else:
-        print("Opción inválida.")
\ No newline at end of file
+if __name__ == "__main__":
+    menu()
\ No newline at end of file